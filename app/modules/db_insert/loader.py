@@ -17,6 +17,7 @@ from database import schemas as db_schemas
 from database.config import DBSettings
 from database.session import create_db_engine, create_session_factory
 from app.modules.db_insert.models import (
+    MAX_ERROR_DETAILS,
     LoadReport,
     StopProcessing,
     TableCounts,
@@ -481,6 +482,7 @@ def run_load(
     on_error: str,
     atomic: bool,
     per_city: bool = False,
+    max_error_details: int = MAX_ERROR_DETAILS,
 ) -> int:
     if not input_dir.exists():
         LOGGER.error("Input directory does not exist: %s", input_dir)
@@ -495,6 +497,7 @@ def run_load(
         report_path=str(report_path),
         validation_skipped=mode == "permissive",
         tables={spec.name: TableCounts() for spec in TABLE_SPECS},
+        max_error_details=max_error_details,
     )
 
     records_by_table = load_records_for_tables(input_dir)
@@ -45,10 +45,11 @@ class LoadReport:
     missing_fields: Dict[str, int] = field(default_factory=dict)
     error_count_total: int = 0
     errors: list[dict[str, Any]] = field(default_factory=list)
+    max_error_details: int = MAX_ERROR_DETAILS
 
     def record_error(self, entry: dict[str, Any]) -> None:
         self.error_count_total += 1
-        if len(self.errors) < MAX_ERROR_DETAILS:
+        if len(self.errors) < self.max_error_details:
             self.errors.append(entry)
 
     def record_missing_field(self, field_name: str) -> None:
@@ -61,3 +62,4 @@ class SchemaInfo:
     alias_to_field: dict[str, str]
     field_to_alias: dict[str, str]
     alias_to_type: dict[str, Any]
+    key_to_alias: dict[str, str]
@@ -21,6 +21,8 @@ Inputs:
   If any table fails, entire load is rolled back
 - --per-city: Use per-city atomic transactions (each city's data is all-or-nothing,
   but different cities load independently). Useful for partial recovery if one city fails
+- --max-errors-in-report: Maximum number of error entries kept in memory and written to the
+  report (default: 50). error_count_total in the report always counts every error
 - Env: DATABASE_URL (loaded from .env for database connection)
 
 Outputs:
@@ -47,6 +49,7 @@ from app.modules.db_insert.loader import (
     ensure_report_path,
     run_load,
 )
+from app.modules.db_insert.models import MAX_ERROR_DETAILS
 from utils.logging_config import setup_logger
 
 LOGGER = logging.getLogger(__name__)
@@ -95,12 +98,21 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Atomic per city (each city is all-or-nothing, but cities load independently).",
     )
+    parser.add_argument(
+        "--max-errors-in-report",
+        type=int,
+        default=MAX_ERROR_DETAILS,
+        help=f"Max error entries kept in the report (default: {MAX_ERROR_DETAILS}).",
+    )
     return parser.parse_args()
 
 
 def main() -> int:
     load_dotenv()
     args = parse_args()
+    if args.max_errors_in_report < 0:
+        LOGGER.error("--max-errors-in-report must be >= 0.")
+        return 1
     report_path = ensure_report_path(args.report_path)
     LOGGER.info(
         "Starting DB load: mode=%s dry_run=%s atomic=%s per_city=%s on_error=%s input_dir=%s",
@@ -119,6 +131,7 @@ def main() -> int:
         on_error=args.on_error,
         atomic=args.atomic,
         per_city=args.per_city,
+        max_error_details=args.max_errors_in_report,
     )
 
 
@@ -9,8 +9,13 @@ from uuid import UUID
 
 from app.modules.db_insert.models import SchemaInfo
 
+_PLAIN_TYPES = frozenset({int, str, bool, float, Decimal, date, datetime, UUID})
+
 
 def unwrap_optional(annotation: Any) -> Any:
+    # Plain classes have no typing origin; skip the introspection calls.
+    if type(annotation) is type and annotation in _PLAIN_TYPES:
+        return annotation
     origin = get_origin(annotation)
     if origin is None:
         return annotation
@@ -63,6 +68,55 @@ def coerce_decimal(value: Any) -> Any:
     return value
 
 
+def _parse_fixed_int(text: str, start: int, end: int) -> int | None:
+    part = text[start:end]
+    if part.isascii() and part.isdigit():
+        return int(part)
+    return None
+
+
+def _parse_iso_date_prefix(text: str) -> date | None:
+    """Parse a leading ``YYYY-MM-DD`` by fixed offsets, or return None."""
+    if len(text) < 10 or text[4] != "-" or text[7] != "-":
+        return None
+    year = _parse_fixed_int(text, 0, 4)
+    month = _parse_fixed_int(text, 5, 7)
+    day = _parse_fixed_int(text, 8, 10)
+    if year is None or month is None or day is None:
+        return None
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _parse_iso_datetime_fast(text: str) -> datetime | None:
+    """Parse ``YYYY-MM-DD`` or ``YYYY-MM-DDTHH:MM:SS[Z]`` by fixed offsets."""
+    length = len(text)
+    if length not in (10, 19, 20):
+        return None
+    parsed_date = _parse_iso_date_prefix(text)
+    if parsed_date is None:
+        return None
+    if length == 10:
+        return datetime(parsed_date.year, parsed_date.month, parsed_date.day)
+    if text[10] != "T" or text[13] != ":" or text[16] != ":":
+        return None
+    if length == 20 and text[19] != "Z":
+        return None
+    hour = _parse_fixed_int(text, 11, 13)
+    minute = _parse_fixed_int(text, 14, 16)
+    second = _parse_fixed_int(text, 17, 19)
+    if hour is None or minute is None or second is None:
+        return None
+    try:
+        return datetime(
+            parsed_date.year, parsed_date.month, parsed_date.day, hour, minute, second
+        )
+    except ValueError:
+        return None
+
+
 def coerce_date(value: Any) -> Any:
     if isinstance(value, date) and not isinstance(value, datetime):
         return value
@@ -76,6 +130,10 @@ def coerce_date(value: Any) -> Any:
             return None
         if text.isdigit() and len(text) == 4:
             return date(int(text), 1, 1)
+        if len(text) == 10 or text[10:11] == "T":
+            parsed = _parse_iso_date_prefix(text)
+            if parsed is not None:
+                return parsed
         text = text.replace("/", "-")
         if "T" in text:
             text = text.split("T")[0]
@@ -103,6 +161,9 @@ def coerce_datetime(value: Any) -> Any:
             return None
         if text.isdigit() and len(text) == 4:
             return datetime(int(text), 1, 1)
+        fast = _parse_iso_datetime_fast(text)
+        if fast is not None:
+            return fast
         if text.endswith("Z"):
             text = text[:-1] + "+00:00"
         try:
@@ -166,11 +227,9 @@ def normalize_record(
     normalized: dict[str, Any] = {}
     unknown_keys: list[str] = []
     for key, value in record.items():
-        if key in info.alias_to_field:
-            alias = key
-        elif key in info.field_to_alias:
-            alias = info.field_to_alias[key]
-        else:
+        # Always emit the canonical (interned) alias, never the raw JSON key.
+        alias = info.key_to_alias.get(key)
+        if alias is None:
             unknown_keys.append(key)
             if not drop_unknown:
                 normalized[key] = value
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+import orjson
+
 from app.modules.db_insert.models import LoadReport
 
 
@@ -34,4 +35,6 @@ def write_report(report: LoadReport, path: Path) -> None:
         "missing_fields": report.missing_fields,
         "errors": report.errors,
     }
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=True), encoding="utf-8")
+    path.write_bytes(
+        orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any, Type
 
 from pydantic import BaseModel
@@ -18,16 +19,23 @@ def get_schema_info(schema: Type[BaseModel]) -> SchemaInfo:
     alias_to_field: dict[str, str] = {}
     field_to_alias: dict[str, str] = {}
     alias_to_type: dict[str, Any] = {}
-    for field_name, field in schema.model_fields.items():
-        alias = field.alias or field_name
+    key_to_alias: dict[str, str] = {}
+    for name, field in schema.model_fields.items():
+        # Interned so every normalized record shares the same key objects.
+        field_name = sys.intern(name)
+        alias = sys.intern(field.alias or field_name)
         alias_to_field[alias] = field_name
         field_to_alias[field_name] = alias
         alias_to_type[alias] = field.annotation
+        key_to_alias[field_name] = alias
+    # Aliases win over field names when the two collide.
+    key_to_alias.update({alias: alias for alias in alias_to_field})
     info = SchemaInfo(
         schema=schema,
         alias_to_field=alias_to_field,
         field_to_alias=field_to_alias,
         alias_to_type=alias_to_type,
+        key_to_alias=key_to_alias,
     )
     _SCHEMA_CACHE[schema] = info
     return info
@@ -4,6 +4,7 @@ Brief: Analyze mapping output structure and statistics.
 Inputs:
 - --input-dir: directory with step3 mapping outputs (default: output/mapping/step3_llm)
 - --sample-size: number of sample records to show per table (default: 1)
+- --serial: analyze tables one by one in this process instead of a process pool
 
 Outputs:
 - Displays file counts, record counts, sample data
@@ -21,6 +22,7 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -68,6 +70,11 @@ def parse_args() -> argparse.Namespace:
         default=1,
         help="Number of sample records to show per table (default: 1).",
     )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Analyze tables sequentially (useful for debugging).",
+    )
     return parser.parse_args()
 
 
@@ -132,6 +139,22 @@ def analyze_table(file_path: Path, sample_size: int) -> dict[str, Any]:
         }
 
 
+def analyze_tables(
+    input_dir: Path, sample_size: int, serial: bool
+) -> list[dict[str, Any]]:
+    """Analyze all expected tables, in EXPECTED_TABLES order.
+
+    Each table is an independent file, so parsing runs in a process pool
+    unless serial is requested.
+    """
+    file_paths = [input_dir / f"{table_name}.json" for table_name in EXPECTED_TABLES]
+    sample_sizes = [sample_size] * len(file_paths)
+    if serial:
+        return list(map(analyze_table, file_paths, sample_sizes))
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(analyze_table, file_paths, sample_sizes))
+
+
 def main() -> int:
     args = parse_args()
     setup_logger()
@@ -156,10 +179,8 @@ def main() -> int:
     print(f"{'Table':<30} {'Records':<15} {'Size':<15} {'Status':<20}")
     print("-" * 80)
 
-    for table_name in EXPECTED_TABLES:
-        file_path = input_dir / f"{table_name}.json"
-        analysis = analyze_table(file_path, args.sample_size)
-
+    analyses = analyze_tables(input_dir, args.sample_size, args.serial)
+    for table_name, analysis in zip(EXPECTED_TABLES, analyses):
         if analysis["error"]:
             status = f"ERROR: {analysis['error']}"
             files_with_errors.append((table_name, analysis["error"]))
@@ -16,37 +16,50 @@ Usage (from project root):
 
 from __future__ import annotations
 
-import json
 import logging
 import sys
 from pathlib import Path
+from typing import Callable
 
+import orjson
 from dotenv import load_dotenv
 
-from app.modules.db_insert.loader import run_load
-from app.scripts.test_db_connection import main as test_connection
-from app.scripts.test_insert import main as test_insert
 from utils.logging_config import setup_logger
 
+# Database and loader modules are imported inside the menu handlers so the
+# menu starts without loading SQLAlchemy models and pydantic schemas.
+
 LOGGER = logging.getLogger(__name__)
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
+EXIT_CHOICE = "6"
+
+MENU_TEXT = "\n".join(
+    [
+        "",
+        "=" * 60,
+        "PDF Converter - Database Load Helper",
+        "=" * 60,
+        "",
+        "Choose an option:",
+        "  1) Test database connection",
+        "  2) Validate mapping output (dry-run, no insert)",
+        "  3) Insert mapping output into database",
+        "  4) Verify database (show row counts and samples)",
+        "  5) Run full workflow (validate → insert → verify)",
+        f"  {EXIT_CHOICE}) Exit",
+        "",
+        "",
+    ]
+)
+
+
 def show_menu() -> str:
     """Display menu and get user choice."""
-    print("\n" + "=" * 60)
-    print("PDF Converter - Database Load Helper")
-    print("=" * 60)
-    print("\nChoose an option:")
-    print("  1) Test database connection")
-    print("  2) Validate mapping output (dry-run, no insert)")
-    print("  3) Insert mapping output into database")
-    print("  4) Verify database (show row counts and samples)")
-    print("  5) Run full workflow (validate → insert → verify)")
-    print("  6) Exit")
-    print()
-    choice = input("Enter choice [1-6]: ").strip()
+    sys.stdout.write(MENU_TEXT)
+    choice = input(f"Enter choice [1-{EXIT_CHOICE}]: ").strip()
     return choice
 
 
@@ -60,13 +73,13 @@ def print_section(title: str) -> None:
 def load_latest_report(pattern: str) -> dict | None:
     """Load the latest report JSON file."""
     report_dir = REPO_ROOT / "output" / "db_load_reports"
-    reports = sorted(
-        report_dir.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True
+    latest = max(
+        report_dir.glob(pattern), key=lambda p: p.stat().st_mtime, default=None
     )
-    if not reports:
+    if latest is None:
         return None
     try:
-        return json.loads(reports[0].read_text(encoding="utf-8"))
+        return orjson.loads(latest.read_bytes())
     except Exception as e:
         LOGGER.error(f"Failed to load report: {e}")
         return None
@@ -122,6 +135,8 @@ def print_report_summary(report: dict) -> None:
 
 def run_test_connection() -> int:
     """Test database connection."""
+    from app.scripts.test_db_connection import main as test_connection
+
     print_section("Testing Database Connection")
     result = test_connection()
     if result == 0:
@@ -133,6 +148,8 @@ def run_test_connection() -> int:
 
 def run_validation() -> int:
     """Run dry-run validation."""
+    from app.modules.db_insert.loader import run_load
+
     print_section("Validating Mapping Output (Dry Run)")
     result = run_load(
         input_dir=REPO_ROOT / "output" / "mapping" / "step3_llm",
@@ -167,6 +184,8 @@ def run_insert() -> int:
         print("Cancelled.")
         return 0
 
+    from app.modules.db_insert.loader import run_load
+
     result = run_load(
         input_dir=REPO_ROOT / "output" / "mapping" / "step3_llm",
         mode="validate",
@@ -190,6 +209,8 @@ def run_insert() -> int:
 
 def run_verify() -> int:
     """Verify database contents."""
+    from app.scripts.test_insert import main as test_insert
+
     print_section("Verifying Database Contents")
     # Override sys.argv for test_insert script
     original_argv = sys.argv
@@ -245,6 +266,15 @@ def run_full_workflow() -> int:
     return 0
 
 
+MENU_HANDLERS: dict[str, Callable[[], int]] = {
+    "1": run_test_connection,
+    "2": run_validation,
+    "3": run_insert,
+    "4": run_verify,
+    "5": run_full_workflow,
+}
+
+
 def main() -> int:
     """Main interactive menu."""
     load_dotenv(REPO_ROOT / ".env")
@@ -252,21 +282,14 @@ def main() -> int:
 
     while True:
         choice = show_menu()
-        if choice == "1":
-            run_test_connection()
-        elif choice == "2":
-            run_validation()
-        elif choice == "3":
-            run_insert()
-        elif choice == "4":
-            run_verify()
-        elif choice == "5":
-            run_full_workflow()
-        elif choice == "6":
+        if choice == EXIT_CHOICE:
             print("\nGoodbye!")
             return 0
-        else:
+        handler = MENU_HANDLERS.get(choice)
+        if handler is None:
             print("Invalid choice. Please try again.")
+            continue
+        handler()
 
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ Inputs:
 - --all: rewrite all records in the table(s)
 - --post-mapping: shorthand for --all + --verify-fks
 - --verify-fks: validate FK coverage before rewriting
+- --max-fk-issues: stop FK verification after this many issues (default: 100, 0 = no limit)
 - --output-dir: optional output directory (default: in-place)
 - --dry-run: preview changes without writing files
 
@@ -26,18 +27,27 @@ from __future__ import annotations
 import argparse
 import json
 import logging
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from uuid import UUID, uuid5
 
 from utils.logging_config import setup_logger
 from mapping.utils.llm_utils import load_json_list, write_json
-from mapping.utils.validate_foreign_keys import TABLE_CONFIG, build_pk_index, find_fk_issues
+from mapping.utils.validate_foreign_keys import (
+    TABLE_CONFIG,
+    build_pk_index,
+    find_fk_issues,
+    referenced_tables,
+)
 
 LOGGER = logging.getLogger(__name__)
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_INPUT_DIR = REPO_ROOT / "output" / "mapping" / "step3_llm"
+MAX_IO_WORKERS = 8
+# --verify-fks only needs to know the mapping is broken; stop scanning here
+# unless --max-fk-issues asks for more.
+MAX_FK_ISSUES = 100
 
 
 def parse_args() -> argparse.Namespace:
@@ -83,6 +93,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Verify FK coverage before rewriting (fails on issues).",
     )
+    parser.add_argument(
+        "--max-fk-issues",
+        type=int,
+        default=MAX_FK_ISSUES,
+        help=f"Stop FK verification after this many issues (default: {MAX_FK_ISSUES}, 0 = no limit).",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -121,42 +137,56 @@ def build_reference_map() -> dict[str, list[tuple[str, str]]]:
     return reference_map
 
 
+# json.dumps builds a new encoder whenever options are passed, so keep one.
+# The seed text must stay byte-identical (it feeds uuid5), which is why this
+# is not switched to orjson: its compact separators would change every ID.
+_SEED_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False)
+
+
 def build_seed(record: dict, pk_field: str) -> str:
     payload = {key: value for key, value in record.items() if key != pk_field}
-    return json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return _SEED_ENCODER.encode(payload)
+
+
+def table_namespace(table_label: str) -> UUID:
+    return uuid5(UUID(int=0), f"rewrite:{table_label}")
 
 
 def deterministic_uuid(
     *,
-    table_label: str,
-    record: dict,
-    pk_field: str,
+    namespace: UUID,
+    seed: str,
     salt: str | None = None,
 ) -> str:
-    seed = build_seed(record, pk_field)
+    """UUID5 of seed (see build_seed) in a table namespace (see table_namespace)."""
     if salt:
         seed = f"{seed}|{salt}"
-    namespace = uuid5(UUID(int=0), f"rewrite:{table_label}")
     return str(uuid5(namespace, seed))
 
 
 def load_all_json(input_dir: Path) -> dict[str, list[dict]]:
-    records_by_file: dict[str, list[dict]] = {}
-    for path in sorted(input_dir.glob("*.json")):
-        records_by_file[path.name] = load_json_list(path)
-    return records_by_file
+    paths = sorted(input_dir.glob("*.json"))
+    if not paths:
+        return {}
+    # Files are independent; read and parse them concurrently.
+    with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(paths))) as executor:
+        return dict(zip((path.name for path in paths), executor.map(load_json_list, paths)))
 
 
-def verify_fk_mapping(records_by_file: dict[str, list[dict]]) -> int:
+def verify_fk_mapping(records_by_file: dict[str, list[dict]], max_issues: int) -> int:
     records_by_table = {
         table: records_by_file.get(table, []) for table in TABLE_CONFIG.keys()
     }
-    pk_index = build_pk_index(records_by_table)
-    issues = find_fk_issues(records_by_table, pk_index)
+    pk_index = build_pk_index(records_by_table, referenced_tables())
+    issues = find_fk_issues(records_by_table, pk_index, max_issues=max_issues or None)
     if not issues:
         LOGGER.info("FK verification passed.")
         return 0
-    LOGGER.error("FK verification failed with %d issue(s).", len(issues))
+    LOGGER.error(
+        "FK verification failed with %s%d issue(s).",
+        "at least " if max_issues and len(issues) >= max_issues else "",
+        len(issues),
+    )
     for table, idx, field, msg in issues[:20]:
         LOGGER.error("FK issue: %s[%d] %s -> %s", table, idx, field, msg)
     return len(issues)
@@ -169,50 +199,39 @@ def rewrite_table_ids(
     target_ids: set[str] | None,
     table_label: str,
 ) -> tuple[dict[str, str], int]:
-    current_ids = [str(rec.get(pk_field)) for rec in records if rec.get(pk_field)]
-    used_ids = set(current_ids)
-    duplicates = {rid for rid, count in Counter(current_ids).items() if count > 1}
-    kept_duplicates: set[str] = set()
-    rotations: dict[str, str] = {}
-    touched = 0
-
+    # One pass reads every ID: the first record with an ID keeps it, later
+    # duplicates are rotated, and records without an ID are left alone.
+    used_ids: set[str] = set()
+    keyed_records: list[tuple[dict, str, bool]] = []
     for record in records:
-        raw_id = record.get(pk_field)
-        if not raw_id:
+        if not (raw_id := record.get(pk_field)):
             continue
         current_id = str(raw_id)
+        keyed_records.append((record, current_id, current_id in used_ids))
+        used_ids.add(current_id)
+    rotations: dict[str, str] = {}
+    touched = 0
+    namespace = table_namespace(table_label)
+
+    for record, current_id, is_duplicate in keyed_records:
         if target_ids is not None and current_id not in target_ids:
             continue
 
-        force_rotate = False
-        if target_ids is not None:
-            force_rotate = True
-        elif current_id in duplicates:
-            if current_id in kept_duplicates:
-                force_rotate = True
-            else:
-                kept_duplicates.add(current_id)
+        force_rotate = target_ids is not None or is_duplicate
 
+        # Serialise the record once; collision retries only change the salt.
+        seed = build_seed(record, pk_field)
+        candidate = deterministic_uuid(namespace=namespace, seed=seed)
+        if candidate == current_id and not force_rotate:
+            # Already canonical: the common case on re-runs.
+            continue
+        # used_ids includes current_id, so this also rotates away from it.
         counter = 0
-        while True:
+        while candidate in used_ids:
+            counter += 1
             candidate = deterministic_uuid(
-                table_label=table_label,
-                record=record,
-                pk_field=pk_field,
-                salt=str(counter) if counter else None,
+                namespace=namespace, seed=seed, salt=str(counter)
             )
-            if candidate == current_id and not force_rotate:
-                break
-            if candidate == current_id and force_rotate:
-                counter += 1
-                continue
-            if candidate in used_ids:
-                counter += 1
-                continue
-            break
-
-        if candidate == current_id and not force_rotate:
-            continue
 
         rotations[current_id] = candidate
         used_ids.add(candidate)
@@ -228,22 +247,29 @@ def apply_fk_updates(
     reference_map: dict[str, list[tuple[str, str]]],
     rotations_by_target: dict[str, dict[str, str]],
 ) -> dict[str, int]:
-    updates: dict[str, int] = {}
+    # Group the rotated FK fields by referencing file so each file is scanned
+    # once, however many of its targets were rewritten.
+    field_maps_by_source: dict[str, list[tuple[str, dict[str, str]]]] = {}
     for target_file, id_map in rotations_by_target.items():
         if not id_map:
             continue
         for source_file, field in reference_map.get(target_file, []):
-            records = records_by_file.get(source_file)
-            if not records:
-                continue
-            updated = 0
-            for record in records:
+            field_maps_by_source.setdefault(source_file, []).append((field, id_map))
+
+    updates: dict[str, int] = {}
+    for source_file, field_maps in field_maps_by_source.items():
+        records = records_by_file.get(source_file)
+        if not records:
+            continue
+        updated = 0
+        for record in records:
+            for field, id_map in field_maps:
                 value = record.get(field)
                 if value in id_map:
                     record[field] = id_map[value]
                     updated += 1
-            if updated:
-                updates[source_file] = updates.get(source_file, 0) + updated
+        if updated:
+            updates[source_file] = updated
     return updates
 
 
@@ -259,6 +285,9 @@ def main() -> int:
         args.all = True
         args.verify_fks = True
 
+    if args.max_fk_issues < 0:
+        LOGGER.error("--max-fk-issues must be >= 0.")
+        return 2
     if args.record_id and args.all:
         LOGGER.error("Choose either --record-id or --all, not both.")
         return 2
@@ -288,7 +317,7 @@ def main() -> int:
         return 1
 
     if args.verify_fks:
-        issue_count = verify_fk_mapping(records_by_file)
+        issue_count = verify_fk_mapping(records_by_file, args.max_fk_issues)
         if issue_count:
             return 2
 
@@ -355,12 +384,17 @@ def main() -> int:
         LOGGER.info("No changes to write.")
         return 0
 
-    for file_name in files_to_write:
-        payload = records_by_file.get(file_name)
-        if payload is None:
-            continue
-        write_json(output_dir / file_name, payload)
-        LOGGER.info("Wrote %s", output_dir / file_name)
+    writes = [
+        (output_dir / file_name, records_by_file[file_name])
+        for file_name in files_to_write
+        if file_name in records_by_file
+    ]
+    if writes:
+        with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(writes))) as executor:
+            # list() re-raises the first write error, if any.
+            list(executor.map(lambda item: write_json(*item), writes))
+    for path, _ in writes:
+        LOGGER.info("Wrote %s", path)
 
     return 0
 
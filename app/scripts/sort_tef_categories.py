@@ -8,7 +8,7 @@ Inputs:
 - --dry-run: preview changes without writing files
 
 Outputs:
-- Sorted JSON file with parents ahead of children
+- Sorted JSON file with parents ahead of children (roots and siblings in tefId order)
 - Logs to stdout/stderr
 
 Usage (from project root):
@@ -20,7 +20,7 @@ from __future__ import annotations
 
 import argparse
 import logging
-from collections import deque
+from collections import defaultdict, deque
 from pathlib import Path
 
 from utils.logging_config import setup_logger
@@ -77,7 +77,7 @@ def topological_sort(records: list[dict]) -> tuple[list[dict], list[str], int]:
             continue
         by_id[tef_id] = record
 
-    children: dict[str, list[str]] = {tef_id: [] for tef_id in by_id}
+    children: defaultdict[str, list[str]] = defaultdict(list)
     in_degree: dict[str, int] = {tef_id: 0 for tef_id in by_id}
 
     for tef_id, record in by_id.items():
@@ -90,21 +90,25 @@ def topological_sort(records: list[dict]) -> tuple[list[dict], list[str], int]:
         else:
             missing_parent_ids.add(str(parent_id))
 
-    queue = deque([tef_id for tef_id, deg in in_degree.items() if deg == 0])
+    # Visit roots and siblings in tefId order so the output does not depend on
+    # the input file's order (and re-runs leave rewrite_mapping_ids a no-op).
+    for siblings in children.values():
+        siblings.sort()
+    queue = deque(sorted(tef_id for tef_id, deg in in_degree.items() if deg == 0))
     ordered_ids: list[str] = []
+    ordered_set: set[str] = set()
     while queue:
         current = queue.popleft()
         ordered_ids.append(current)
+        ordered_set.add(current)
         for child in children.get(current, []):
             in_degree[child] -= 1
             if in_degree[child] == 0:
                 queue.append(child)
 
     if len(ordered_ids) < len(by_id):
-        remaining = [
-            tef_id for tef_id in by_id.keys() if tef_id not in set(ordered_ids)
-        ]
-        ordered_ids.extend(remaining)
+        # Records caught in a parent cycle go last, in tefId order.
+        ordered_ids.extend(sorted(by_id.keys() - ordered_set))
 
     ordered_records = [by_id[tef_id] for tef_id in ordered_ids]
     if duplicates:
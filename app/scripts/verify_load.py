@@ -24,12 +24,15 @@ TABLE CATEGORIES:
 Inputs:
 - --json-dir: directory with mapped JSON files (default: output/mapping/step3_llm)
 - --city-id: optional city UUID to verify specific city only
+- --no-cache: re-parse every JSON file instead of reusing the per-file ID sets cached in
+  output/.cache/verify_load (keyed on path, mtime and size)
 - Env: DATABASE_URL (loaded from .env)
 
 Outputs:
 - Detailed report comparing JSON counts vs DB row counts
 - Logs differences (missing records, extra records, etc.)
-- JSON report to output/db_load_reports/verify_load_*.json
+- JSON report to output/db_load_reports/verify_load_*.json (up to 50 missing/extra IDs
+  per table, plus totals)
 - Exit code 0 if all records loaded, 1 if mismatches
 
 Usage (from project root):
@@ -41,13 +44,18 @@ Usage (from project root):
 from __future__ import annotations
 
 import argparse
+import hashlib
+import heapq
 import json
 import logging
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 from uuid import UUID
 
+import orjson
 from dotenv import load_dotenv
 from sqlalchemy import text
 
@@ -60,6 +68,16 @@ LOGGER = logging.getLogger(__name__)
 REPO_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_JSON_DIR = REPO_ROOT / "output" / "mapping" / "step3_llm"
 DEFAULT_REPORT_DIR = REPO_ROOT / "output" / "db_load_reports"
+# Max IDs listed per missing/extra list in the report.
+REPORT_SAMPLE_SIZE = 50
+DEFAULT_CACHE_DIR = REPO_ROOT / "output" / ".cache" / "verify_load"
+# Part of every cache key; bump when the pickled ID set layout changes.
+_CACHE_FORMAT = 2
+# Concurrent table queries when pipelining is unavailable; stays within the
+# engine's default connection pool (5 + 10 overflow).
+MAX_QUERY_WORKERS = 8
+# Rows fetched per page when streaming IDs from the database.
+DB_FETCH_SIZE = 10_000
 
 # Tables with UUID primary keys
 TABLE_ID_FIELDS = {
@@ -129,109 +147,248 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional city UUID to verify specific city only",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always re-parse the JSON files instead of reusing ID sets cached in {DEFAULT_CACHE_DIR}",
+    )
     return parser.parse_args()
 
 
-def load_json_records(json_dir: Path) -> dict[str, list[dict[str, Any]]]:
-    """Load all JSON files from the directory."""
-    records_by_table: dict[str, list[dict[str, Any]]] = {}
+# A record ID as a set key: the UUID's 128-bit int, or the raw string when it
+# is not a valid UUID (so it still shows up as missing rather than crashing).
+IdKey = int | str
+
+# Per table: record IDs grouped by the record's cityId (None when it has none).
+JsonIdSets = dict[str, dict[str | None, set[IdKey]]]
+
+
+def _id_key(value: object) -> IdKey:
+    """
+    Compact, case-insensitive set key for an ID: int keys hash in one step
+    and take far less memory than 36-character strings.
+    """
+    if isinstance(value, UUID):
+        return value.int
+    text_value = str(value)
+    try:
+        return UUID(text_value).int
+    except ValueError:
+        return text_value
+
+
+def _format_id(key: IdKey) -> str:
+    return str(UUID(int=key)) if isinstance(key, int) else key
+
+
+def _id_sets_cache_path(cache_dir: Path, json_file: Path, id_field: str) -> Path:
+    """Cache file for json_file's ID sets, keyed on its path, mtime, size and ID field."""
+    stat = json_file.stat()
+    key = f"{json_file.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:{id_field}:{_CACHE_FORMAT}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return cache_dir / f"{digest}.pkl"
+
+
+def _read_json_ids(json_file: Path, id_field: str) -> dict[str | None, set[IdKey]] | None:
+    """Group the record IDs of one JSON file by cityId; None if it cannot be parsed."""
+    try:
+        # Parse straight from bytes: no intermediate str copy of the file.
+        data = orjson.loads(json_file.read_bytes())
+    except Exception as exc:
+        LOGGER.error("Failed to load %s: %s", json_file, exc)
+        return None
+    records = data if isinstance(data, list) else []
+    ids_by_city: dict[str | None, set[IdKey]] = {}
+    # The per-table city filter is applied later, once per cityId group, so
+    # this loop does no table-level branching and one lookup per field.
+    for record in records:
+        city_id = record.get("cityId") or None
+        ids = ids_by_city.get(city_id)
+        if ids is None:
+            ids = ids_by_city[city_id] = set()
+        if raw_id := record.get(id_field):
+            ids.add(_id_key(raw_id))
+    LOGGER.info("Loaded %d records from %s", len(records), json_file.name)
+    return ids_by_city
+
+
+def load_json_id_sets(json_dir: Path, cache_dir: Path | None = None) -> JsonIdSets:
+    """
+    Load all JSON files from the directory, keeping only record IDs by cityId.
+
+    Each file's records are dropped as soon as its IDs are extracted, so only
+    the ID strings stay resident rather than every parsed record. With
+    cache_dir, the extracted IDs are pickled per file (keyed on path, mtime
+    and size) so unchanged files are not parsed again on the next run.
+    """
+    id_sets: JsonIdSets = {}
     for table_name, id_field in TABLE_ID_FIELDS.items():
+        id_sets[table_name] = {}
         json_file = json_dir / f"{table_name}.json"
         if not json_file.exists():
             LOGGER.warning("JSON file not found: %s", json_file)
-            records_by_table[table_name] = []
             continue
-        try:
-            data = json.loads(json_file.read_text(encoding="utf-8"))
-            records_by_table[table_name] = data if isinstance(data, list) else []
-            LOGGER.info(
-                "Loaded %d records from %s.json",
-                len(records_by_table[table_name]),
-                table_name,
-            )
-        except Exception as exc:
-            LOGGER.error("Failed to load %s: %s", json_file, exc)
-            records_by_table[table_name] = []
-    return records_by_table
+
+        cache_path = (
+            _id_sets_cache_path(cache_dir, json_file, id_field) if cache_dir else None
+        )
+        if cache_path is not None and cache_path.exists():
+            try:
+                id_sets[table_name] = pickle.loads(cache_path.read_bytes())
+                LOGGER.info("Loaded %s IDs from cache", json_file.name)
+                continue
+            except Exception as exc:
+                LOGGER.warning("Ignoring unreadable cache %s: %s", cache_path, exc)
+
+        ids_by_city = _read_json_ids(json_file, id_field)
+        if ids_by_city is None:
+            continue
+        id_sets[table_name] = ids_by_city
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(
+                    pickle.dumps(ids_by_city, protocol=pickle.HIGHEST_PROTOCOL)
+                )
+            except OSError as exc:
+                LOGGER.warning("Could not write cache %s: %s", cache_path, exc)
+    return id_sets
 
 
-def extract_city_ids_from_json(
-    records_by_table: dict[str, list[dict[str, Any]]],
-) -> set[str]:
+def extract_city_ids_from_json(id_sets: JsonIdSets) -> set[str]:
     """Extract all unique city IDs from JSON records."""
-    city_ids: set[str] = set()
-    for records in records_by_table.values():
-        for record in records:
-            if "cityId" in record and record["cityId"]:
-                city_ids.add(str(record["cityId"]))
-    return city_ids
+    return {
+        str(city_id)
+        for ids_by_city in id_sets.values()
+        for city_id in ids_by_city
+        if city_id is not None
+    }
+
+
+def _db_uuid_sql(table: str, id_field: str, city_ids_param: str | None) -> str:
+    """
+    SQL selecting the IDs of table; city_ids_param is the driver-specific
+    placeholder for the city ID array, or None to select every row.
+    """
+    sql = f'SELECT "{id_field}" FROM "{table}"'
+    if city_ids_param is None:
+        return sql
+    # Bind the IDs as one array parameter: the SQL text stays the same for any
+    # number of cities and IDs are never interpolated.
+    return f'{sql} WHERE "cityId" = ANY(CAST({city_ids_param} AS uuid[]))'
+
+
+def _filters_by_city(table: str, city_ids: set[str] | None) -> bool:
+    return bool(city_ids) and table in TABLES_WITH_DIRECT_CITY_ID
 
 
 def get_db_uuids(
     conn, table: str, id_field: str, city_ids: set[str] | None = None
-) -> set[str]:
+) -> set[IdKey]:
     """
     Get all UUIDs from a table in the database.
 
     For tables with direct cityId: filter by city
     For reference tables: get all, but understanding they're filtered through relationships
     """
+    # Stream through a server-side cursor in pages so only the ID set is
+    # resident, not a full list of rows.
+    conn = conn.execution_options(stream_results=True, yield_per=DB_FETCH_SIZE)
     try:
-        # Direct cityId filter for tables with cityId column
-        if city_ids and table in TABLES_WITH_DIRECT_CITY_ID:
-            placeholders = ", ".join(f"'{cid}'" for cid in city_ids)
-            query = text(
-                f'SELECT "{id_field}" FROM "{table}" WHERE "cityId" IN ({placeholders})'
-            )
-            result = conn.execute(query)
-            return {str(row[0]) for row in result.fetchall()}
-
-        # For reference tables, get ALL records but we'll understand they're global
-        query = text(f'SELECT "{id_field}" FROM "{table}"')
-        result = conn.execute(query)
-        return {str(row[0]) for row in result.fetchall()}
+        if _filters_by_city(table, city_ids):
+            query = text(_db_uuid_sql(table, id_field, ":city_ids"))
+            result = conn.execute(query, {"city_ids": sorted(city_ids)})
+        else:
+            # For reference tables, get ALL records but we'll understand they're global
+            result = conn.execute(text(_db_uuid_sql(table, id_field, None)))
+        return {_id_key(row[0]) for row in result}
 
     except Exception as exc:
         LOGGER.error("Query failed for %s: %s", table, exc)
         raise
 
 
+def _get_db_uuids_pipelined(
+    conn, city_ids: set[str] | None
+) -> dict[str, set[IdKey]]:
+    """Send every table's SELECT in one psycopg pipeline and collect the results."""
+    raw = conn.connection.driver_connection
+    params = {"city_ids": sorted(city_ids or ())}
+    cursors = {}
+    with raw.pipeline():
+        for table, id_field in TABLE_ID_FIELDS.items():
+            cursor = raw.cursor()
+            if _filters_by_city(table, city_ids):
+                cursor.execute(_db_uuid_sql(table, id_field, "%(city_ids)s"), params)
+            else:
+                cursor.execute(_db_uuid_sql(table, id_field, None))
+            cursors[table] = cursor
+    # Leaving the pipeline block synced every result; draining is local.
+    db_uuids: dict[str, set[IdKey]] = {}
+    for table, cursor in cursors.items():
+        with cursor:
+            db_uuids[table] = {_id_key(row[0]) for row in cursor.fetchall()}
+    return db_uuids
+
+
+def get_all_db_uuids(
+    engine, city_ids: set[str] | None = None
+) -> dict[str, set[IdKey] | Exception]:
+    """
+    Get the UUIDs of every table in TABLE_ID_FIELDS.
+
+    On psycopg the SELECTs are pipelined over one connection, costing one
+    round trip instead of one per table. Otherwise (or if that fails) the
+    tables are queried concurrently, each on its own pooled connection, so
+    a failure is reported against its own table only.
+    """
+    if engine.dialect.name == "postgresql" and engine.dialect.driver == "psycopg":
+        try:
+            with engine.connect() as conn:
+                return _get_db_uuids_pipelined(conn, city_ids)
+        except Exception as exc:
+            LOGGER.warning("Pipelined ID queries failed (%s); querying tables one by one.", exc)
+
+    def _query(table_name: str) -> set[IdKey] | Exception:
+        try:
+            with engine.connect() as conn:
+                return get_db_uuids(conn, table_name, TABLE_ID_FIELDS[table_name], city_ids)
+        except Exception as exc:
+            return exc
+
+    tables = list(TABLE_ID_FIELDS)
+    with ThreadPoolExecutor(max_workers=min(MAX_QUERY_WORKERS, len(tables))) as executor:
+        return dict(zip(tables, executor.map(_query, tables)))
+
+
 def get_json_uuids(
-    records: list[dict[str, Any]],
-    id_field: str,
+    ids_by_city: dict[str | None, set[IdKey]],
     table_name: str,
     city_ids: set[str] | None = None,
-) -> set[str]:
+) -> set[IdKey]:
     """Get all UUIDs from JSON records, optionally filtered by city IDs."""
-    uuids = set()
-    for record in records:
-        if id_field in record and record[id_field]:
-            # Filter by city IDs for tables with direct cityId
-            if city_ids and table_name in TABLES_WITH_DIRECT_CITY_ID:
-                if record.get("cityId") in city_ids:
-                    uuids.add(str(record[id_field]))
-            # For city-FK-related tables, filter by InitiativeId or IndicatorId cityId
-            elif city_ids and table_name in TABLES_CITY_FK_RELATED:
-                # These should have been filtered in mapping based on related entity's city
-                # For now, include all and let JSON show the expected subset
-                uuids.add(str(record[id_field]))
-            else:
-                # Shared reference tables: include all
-                uuids.add(str(record[id_field]))
-    return uuids
+    # Filter by city IDs for tables with direct cityId. City-FK-related tables
+    # should have been filtered in mapping based on the related entity's city,
+    # so they (and shared reference tables) include every record.
+    if city_ids and table_name in TABLES_WITH_DIRECT_CITY_ID:
+        groups = [ids for city_id, ids in ids_by_city.items() if city_id in city_ids]
+    else:
+        groups = list(ids_by_city.values())
+    return set().union(*groups)
+
+
+def _sample_ids(keys: set[IdKey]) -> list[str]:
+    """The REPORT_SAMPLE_SIZE smallest IDs, as strings in sorted order."""
+    return heapq.nsmallest(REPORT_SAMPLE_SIZE, map(_format_id, keys))
 
 
 def compare_records(
     *,
     table_name: str,
-    json_records: list[dict[str, Any]],
-    db_uuids: set[str],
-    id_field: str,
-    city_ids: set[str] | None = None,
+    json_uuids: set[IdKey],
+    db_uuids: set[IdKey],
 ) -> dict[str, Any]:
-    """Compare JSON records with database."""
-    json_uuids = get_json_uuids(json_records, id_field, table_name, city_ids)
-
+    """Compare JSON record IDs with database."""
     missing_in_db = json_uuids - db_uuids
     extra_in_db = db_uuids - json_uuids
     matched = json_uuids & db_uuids
@@ -241,8 +398,11 @@ def compare_records(
         "json_count": len(json_uuids),
         "db_count": len(db_uuids),
         "matched": len(matched),
-        "missing_in_db": sorted(list(missing_in_db)),
-        "extra_in_db": sorted(list(extra_in_db)),
+        # The report keeps a sorted sample; the totals give the full size.
+        "missing_in_db": _sample_ids(missing_in_db),
+        "missing_total": len(missing_in_db),
+        "extra_in_db": _sample_ids(extra_in_db),
+        "extra_total": len(extra_in_db),
         "ok": len(missing_in_db) == 0,  # OK if all JSON records are in DB
         "is_shared_table": table_name in SHARED_REFERENCE_TABLES,
     }
@@ -285,7 +445,9 @@ def compare_records(
         )
         if missing_in_db:
             LOGGER.warning(
-                "  Missing in DB (%d): %s", len(missing_in_db), list(missing_in_db)[:5]
+                "  Missing in DB (%d): %s",
+                len(missing_in_db),
+                [_format_id(key) for key in list(missing_in_db)[:5]],
             )
 
     return result
@@ -307,14 +469,16 @@ def main() -> int:
 
     # Load JSON records
     LOGGER.info("Loading JSON records from %s", args.json_dir)
-    json_records_by_table = load_json_records(args.json_dir)
+    json_id_sets = load_json_id_sets(
+        args.json_dir, cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR
+    )
 
     # Auto-detect city IDs from JSON (if not manually specified)
     if args.city_id:
         city_ids = {args.city_id}
         LOGGER.info("Verifying specific city: %s", args.city_id)
     else:
-        city_ids = extract_city_ids_from_json(json_records_by_table)
+        city_ids = extract_city_ids_from_json(json_id_sets)
         LOGGER.info(
             "Auto-detected %d city(ies) in JSON: %s", len(city_ids), sorted(city_ids)
         )
@@ -325,33 +489,28 @@ def main() -> int:
     all_ok = True
 
     try:
-        with engine.connect() as conn:
-            for table_name, id_field in TABLE_ID_FIELDS.items():
-                json_records = json_records_by_table.get(table_name, [])
-
-                try:
-                    db_uuids = get_db_uuids(conn, table_name, id_field, city_ids)
-                except Exception as exc:
-                    LOGGER.error("Failed to query %s: %s", table_name, exc)
-                    results["table_results"].append(
-                        {
-                            "table": table_name,
-                            "error": str(exc),
-                        }
-                    )
-                    all_ok = False
-                    continue
-
-                result = compare_records(
-                    table_name=table_name,
-                    json_records=json_records,
-                    db_uuids=db_uuids,
-                    id_field=id_field,
-                    city_ids=city_ids,
+        db_uuids_by_table = get_all_db_uuids(engine, city_ids)
+        for table_name in TABLE_ID_FIELDS:
+            db_uuids = db_uuids_by_table[table_name]
+            if isinstance(db_uuids, Exception):
+                LOGGER.error("Failed to query %s: %s", table_name, db_uuids)
+                results["table_results"].append(
+                    {
+                        "table": table_name,
+                        "error": str(db_uuids),
+                    }
                 )
-                results["table_results"].append(result)
-                if not result["ok"]:
-                    all_ok = False
+                all_ok = False
+                continue
+
+            result = compare_records(
+                table_name=table_name,
+                json_uuids=get_json_uuids(json_id_sets[table_name], table_name, city_ids),
+                db_uuids=db_uuids,
+            )
+            results["table_results"].append(result)
+            if not result["ok"]:
+                all_ok = False
     except Exception as exc:
         LOGGER.exception("Database connection failed: %s", exc)
         return 1
@@ -12,10 +12,14 @@ def create_db_engine(*, settings: DBSettings) -> Engine:
     Create a synchronous SQLAlchemy engine.
 
     Sync engine is the simplest + most compatible option for Alembic migrations.
+    Pooled connections are pinged before use and, when DB_POOL_RECYCLE is set,
+    replaced after that many seconds, so long-running loads do not fail on
+    connections dropped by NAT/idle timeouts.
     """
     return create_engine(
         settings.database_url,
         pool_pre_ping=True,
+        pool_recycle=settings.pool_recycle,
         future=True,
     )
 
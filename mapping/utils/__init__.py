@@ -18,7 +18,12 @@ from mapping.utils.apply_city_mapping import (
     write_json as write_city_json,
 )
 from mapping.utils.clear_foreign_keys import FK_FIELDS, clear_fields, process_file
-from mapping.utils.validate_foreign_keys import find_fk_issues, build_pk_index, load_json_list as load_json_list_fk
+from mapping.utils.validate_foreign_keys import (
+    find_fk_issues,
+    build_pk_index,
+    referenced_tables,
+    load_json_list as load_json_list_fk,
+)
 
 __all__ = [
     "LLMSelector",
@@ -39,5 +44,6 @@ __all__ = [
     "process_file",
     "find_fk_issues",
     "build_pk_index",
+    "referenced_tables",
     "load_json_list_fk",
 ]
@@ -99,10 +99,26 @@ def load_json_list(path: Path) -> list[dict] | None:
         raise
 
 
-def build_pk_index(records_by_table: dict[str, list[dict]]) -> dict[str, set]:
+def referenced_tables() -> set[str]:
+    """Return the tables that are the target of at least one FK."""
+    return {
+        target_table
+        for cfg in TABLE_CONFIG.values()
+        for _, target_table, _ in cfg.get("fks", [])
+    }
+
+
+def build_pk_index(
+    records_by_table: dict[str, list[dict]],
+    tables: Iterable[str] | None = None,
+) -> dict[str, set]:
+    """
+    Index primary keys per table; pass tables to index only those
+    (e.g. referenced_tables(), since only FK targets are ever looked up).
+    """
     pk_index: dict[str, set] = {}
-    for table, cfg in TABLE_CONFIG.items():
-        pk_field = cfg["pk"]
+    for table in TABLE_CONFIG if tables is None else tables:
+        pk_field = TABLE_CONFIG[table]["pk"]
         values = {r[pk_field] for r in records_by_table.get(table, []) if r.get(pk_field)}
         pk_index[table] = values
     return pk_index
@@ -111,10 +127,13 @@ def build_pk_index(records_by_table: dict[str, list[dict]]) -> dict[str, set]:
 def find_fk_issues(
     records_by_table: dict[str, list[dict]],
     pk_index: dict[str, set],
+    max_issues: int | None = None,
 ) -> list[tuple[str, int, str, str]]:
     """
     Returns a list of issues:
     (table, record_index, field, message)
+
+    Stops early once max_issues issues have been found (None = report all).
     """
     issues: list[tuple[str, int, str, str]] = []
     for table, cfg in TABLE_CONFIG.items():
@@ -126,11 +145,14 @@ def find_fk_issues(
                     if optional:
                         continue
                     issues.append((table, idx, field, "missing required FK value"))
-                    continue
-                if value not in pk_index.get(target_table, set()):
+                elif value not in pk_index.get(target_table, set()):
                     issues.append(
                         (table, idx, field, f"value {value!r} not found in {target_table}")
                     )
+                else:
+                    continue
+                if max_issues is not None and len(issues) >= max_issues:
+                    return issues
     return issues
 
 
@@ -3,94 +3,524 @@
 Brief: Convert PDFs to Markdown using Mistral OCR with optional vision refinement.
 
 Inputs:
-- --input: PDF file to process (required)
+- --input: one or more PDF files or directories of PDFs to process (required)
+- --pattern: filename glob for PDFs when --input is a directory (default: *.pdf; subfolders are scanned lazily)
+- --concurrency: number of PDFs converted at the same time (default: env PDF_CONCURRENCY or 4);
+  PDFs above --max-upload-bytes (split per page) use a separate pool of PDF_CONCURRENCY_LARGE (2)
+- --ocr-rps: max OCR requests started per second across all PDFs and pages
+  (default: env OCR_RPS or 0 = unlimited)
+- --ocr-max-concurrency: max OCR requests in flight across all PDFs and pages
+  (default: env OCR_MAX_CONCURRENCY or 0 = unlimited)
+- --progress/--no-progress: show a progress bar instead of per-PDF "Processing" log lines
 - --output-dir: output directory for OCR artifacts
+- --force: reconvert PDFs whose existing output has a matching .fingerprint
+- --pack-small-pdfs: merge small PDFs into one OCR request up to --max-upload-bytes
 - --no-images/--save-response/--max-upload-bytes/--vision-model/--vision-temperature
-- Env: MISTRAL_API_KEY, OPENROUTER_API_KEY, OPENROUTER_BASE_URL, OCR_MODEL, VISION_MODEL
+- --vision-image-max-dim: long-edge pixel cap for page images sent to the vision model
+  (default: env VISION_IMAGE_MAX_DIM or 1600; 0 = full size)
+- --vision-batch-size: consecutive pages sent per vision request (default: env
+  VISION_BATCH_SIZE or 2; windows overlap on one page so every boundary is reviewed)
+- --vision-refine-all: send every page window to the vision model, not only pages
+  that fail the cheap OCR quality heuristic (images or figures, replacement/control
+  characters, table rows whose cell count differs from the header)
+- Env: MISTRAL_API_KEY, OPENROUTER_API_KEY, OPENROUTER_BASE_URL, OCR_MODEL, VISION_MODEL,
+  PDF_CONCURRENCY, OCR_RPS, OCR_MAX_CONCURRENCY,
+  OCR_CONCURRENCY (16 parallel page requests when a large PDF is split)
+- Env (vision only, parsed only when a vision model is enabled): VISION_MAX_ROUNDS (3),
+  VISION_MAX_RETRIES (3), VISION_RETRY_BASE_DELAY (2.0), VISION_TEMPERATURE,
+  VISION_CONCURRENCY (4 page windows refined in parallel per PDF),
+  VISION_IMAGE_MAX_DIM (1600 px long edge, 0 = full size), VISION_IMAGE_DETAIL (auto|low|high)
+- Env (rate-limit retries per PDF): PDF_MAX_RETRIES (3), PDF_RETRY_BASE_DELAY (1.0),
+  PDF_RETRY_MAX_DELAY (30.0), PDF_RETRY_JITTER (0.5)
 - Config: llm_config.yml (pdf2markdown.model, pdf2markdown.temperature, pdf2markdown.ocr_model)
 
 Outputs:
 - Markdown files, images, and OCR response artifacts in the output directory
+- A .fingerprint file per output folder (PDF bytes + OCR/vision model) used to skip
+  unchanged PDFs on re-runs
 - Logs to stdout/stderr
+- Exit codes: 0 success, 1 invalid arguments/config, 2 no PDF converted,
+  3 missing API keys (MISTRAL_API_KEY, plus OPENROUTER_API_KEY when vision is enabled)
 
 Usage (from project root):
 - python -m pdf2markdown.pdf_to_markdown --input documents/sample.pdf
+- python -m pdf2markdown.pdf_to_markdown --input documents/ --concurrency 8
+- python -m pdf2markdown.pdf_to_markdown --input a.pdf b.pdf more_documents/
+- python -m pdf2markdown.pdf_to_markdown --input documents/ --pack-small-pdfs
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import fnmatch
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Awaitable, Callable, Iterable, Iterator, Mapping, Sequence
 
 from dotenv import load_dotenv
+from tqdm import tqdm
 
-from utils import load_llm_config, setup_logger
-from pdf2markdown.utils.pdf_to_markdown_pipeline import pdf_to_markdown_pipeline
+from utils import setup_logger
+from pdf2markdown.utils.clients import create_mistral_client, create_vision_client
+from pdf2markdown.utils.fingerprint import (
+    compute_fingerprint,
+    find_matching_output,
+    write_fingerprint,
+)
+from pdf2markdown.utils.http_client import create_http_client
+from pdf2markdown.utils.pdf_to_markdown_pipeline import (
+    pdf_batch_to_markdown_pipeline,
+    pdf_to_markdown_pipeline,
+)
+from pdf2markdown.utils.rate_limiter import RateLimiter
+from pdf2markdown.utils.retry_utils import backoff_delay, is_rate_limit_error
+from pdf2markdown.utils.settings import get_settings, get_vision_settings
 
 logger = logging.getLogger(__name__)
 
 
+def _iter_pdfs(
+    root: Path, pattern: str, exclude_dirs: frozenset[str] = frozenset()
+) -> Iterator[Path]:
+    """Lazily yield files under root whose name matches pattern (recursive, sorted per directory).
+
+    Uses os.scandir so only one directory listing is held at a time, instead of
+    materialising every match up front. Directories whose resolved path is in
+    exclude_dirs are pruned without being listed.
+    """
+    with os.scandir(root) as entries:
+        ordered = sorted(entries, key=lambda entry: entry.name)
+    for entry in ordered:
+        if entry.is_dir(follow_symlinks=False):
+            if exclude_dirs and os.path.realpath(entry.path) in exclude_dirs:
+                continue
+            yield from _iter_pdfs(Path(entry.path), pattern, exclude_dirs)
+        # Match the name first: it is a pure string test, while is_file() may
+        # need a stat() on filesystems that do not report entry types.
+        elif fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+            yield Path(entry.path)
+
+
+def _resolve_inputs(
+    input_paths: Sequence[Path],
+    pattern: str,
+    exclude_dirs: Iterable[Path] = (),
+) -> Iterator[Path]:
+    """Yield the PDFs to convert: each file itself, or the matches under each directory.
+
+    Subtrees under exclude_dirs (e.g. the output folder when it sits inside an
+    input directory) are skipped while walking rather than filtered afterwards.
+    """
+    excluded = frozenset(os.path.realpath(path) for path in exclude_dirs)
+    for input_path in input_paths:
+        if input_path.is_dir():
+            yield from _iter_pdfs(input_path, pattern, excluded)
+        else:
+            yield input_path
+
+
+def _select_pending(
+    batch: Sequence[Path],
+    *,
+    output_root: Path,
+    ocr_model: str,
+    vision_model: str,
+    force: bool,
+) -> dict[Path, str]:
+    """Map each PDF in batch that still needs converting to its fingerprint."""
+    pending: dict[Path, str] = {}
+    for pdf in batch:
+        fingerprint = compute_fingerprint(pdf, ocr_model, vision_model)
+        existing = None if force else find_matching_output(output_root, pdf, fingerprint)
+        if existing is not None:
+            logger.info("Skipping %s (already converted in %s).", pdf, existing)
+            continue
+        pending[pdf] = fingerprint
+    return pending
+
+
+def _pack_pdfs(pdfs: Sequence[Path], max_bytes: int) -> list[list[Path]]:
+    """Group PDFs into batches whose summed size fits max_bytes (first-fit decreasing).
+
+    PDFs larger than max_bytes (or all PDFs when max_bytes <= 0) get a batch of
+    their own so they keep the regular per-document (or split) pipeline.
+    """
+    if max_bytes <= 0:
+        return [[pdf] for pdf in pdfs]
+    sized = sorted(((pdf.stat().st_size, pdf) for pdf in pdfs), key=lambda x: -x[0])
+    batches: list[list[Path]] = []
+    remaining: list[int] = []
+    for size, pdf in sized:
+        if size > max_bytes:
+            batches.append([pdf])
+            remaining.append(-1)
+            continue
+        for idx, free in enumerate(remaining):
+            if size <= free:
+                batches[idx].append(pdf)
+                remaining[idx] -= size
+                break
+        else:
+            batches.append([pdf])
+            remaining.append(max_bytes - size)
+    return batches
+
+
+def _convert_batch(
+    fingerprints: Mapping[Path, str],
+    *,
+    convert_one: Callable[[Path], Path],
+    convert_many: Callable[[Sequence[Path]], list[Path]],
+) -> list[Path]:
+    """Convert a single PDF with the regular pipeline, or several with one merged OCR request.
+
+    fingerprints maps each PDF to convert to its fingerprint, which is written
+    next to its Markdown so later runs can skip it.
+    """
+    batch = list(fingerprints)
+    if len(batch) == 1:
+        markdown_paths = [convert_one(batch[0])]
+    else:
+        markdown_paths = convert_many(batch)
+    for pdf, markdown_path in zip(batch, markdown_paths):
+        write_fingerprint(markdown_path.parent, fingerprints[pdf])
+    return markdown_paths
+
+
+def _describe_batch(batch: Iterable[Path]) -> str:
+    return ", ".join(pdf.name for pdf in batch)
+
+
+async def _convert_with_retry(
+    batch: Mapping[Path, str],
+    *,
+    convert: Callable[[Mapping[Path, str]], list[Path]],
+    max_attempts: int,
+    base_delay: float,
+    max_delay: float,
+    jitter: float,
+) -> list[Path]:
+    """Run convert in a worker thread, retrying with exponential backoff on rate limits.
+
+    The backoff is awaited on the event loop, so no thread is held while waiting
+    and other PDFs keep progressing. The pipelines delete a failed attempt's
+    output directories, so each retry starts from a clean slate.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await asyncio.to_thread(convert, batch)
+        except Exception as exc:
+            if not is_rate_limit_error(exc) or attempt >= max_attempts - 1:
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay, jitter)
+            logger.warning(
+                "Rate limited while converting %s (%s). Retrying in %.1f seconds (%d/%d).",
+                _describe_batch(batch),
+                exc.__class__.__name__,
+                delay,
+                attempt + 1,
+                max_attempts,
+            )
+            await asyncio.sleep(delay)
+    raise RuntimeError("Unexpected PDF retry loop termination.")
+
+
+def _is_large_batch(batch: Sequence[Path], max_upload_bytes: int) -> bool:
+    """Return True if the batch holds a PDF the pipeline will split into per-page requests."""
+    return max_upload_bytes > 0 and any(
+        pdf.stat().st_size > max_upload_bytes for pdf in batch
+    )
+
+
+async def _convert_concurrently(
+    batches: Iterable[Sequence[Path]],
+    convert: Callable[[Mapping[Path, str]], Awaitable[list[Path]]],
+    select_pending: Callable[[Sequence[Path]], dict[Path, str]],
+    concurrency: int,
+    *,
+    is_large: Callable[[Sequence[Path]], bool] = lambda batch: False,
+    large_concurrency: int = 1,
+    progress: bool = False,
+) -> tuple[int, int, int]:
+    """Convert batches with worker tasks fed from bounded queues.
+
+    OCR and vision calls are network-bound, so overlapping PDFs hides request
+    latency. Batches flagged by is_large (PDFs that get split into per-page OCR
+    requests, which already fan out internally) go to a separate pool of
+    large_concurrency workers, so a few big documents cannot crowd out the
+    concurrency workers serving small ones. batches is consumed lazily so only
+    about twice the worker count is resident at once. OCR request pacing is
+    done per request inside the pipeline (see RateLimiter). With progress, a
+    single progress bar replaces the per-PDF "Processing" log lines.
+    Returns (converted, skipped, total) PDF counts.
+    """
+    # Every worker holds at most one to_thread call at a time, so size the
+    # default executor to the worker count; the stock min(32, cpu + 4) threads
+    # would otherwise silently cap in-flight PDFs below --concurrency.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=concurrency + large_concurrency,
+            thread_name_prefix="pdf2markdown",
+        )
+    )
+    pools = {
+        "small": (asyncio.Queue(maxsize=2 * concurrency), concurrency),
+        "large": (asyncio.Queue(maxsize=2 * large_concurrency), large_concurrency),
+    }
+    progress_bar = tqdm(unit="pdf", disable=not progress)
+    converted = skipped = total = 0
+
+    async def _produce() -> None:
+        nonlocal total
+        for batch in batches:
+            total += len(batch)
+            progress_bar.total = total
+            progress_bar.refresh()
+            queue, _ = pools["large" if is_large(batch) else "small"]
+            await queue.put(batch)
+        for queue, workers in pools.values():
+            for _ in range(workers):
+                await queue.put(None)
+
+    async def _consume(queue: asyncio.Queue[Sequence[Path] | None]) -> None:
+        nonlocal converted, skipped
+        while (batch := await queue.get()) is not None:
+            try:
+                pending = await asyncio.to_thread(select_pending, batch)
+                skipped += len(batch) - len(pending)
+                if not pending:
+                    continue
+                logger.log(
+                    logging.DEBUG if progress else logging.INFO,
+                    "Processing %s",
+                    _describe_batch(pending),
+                )
+                await convert(pending)
+                converted += len(pending)
+            except Exception as exc:
+                logger.error(
+                    "Failed to convert %s: %s", _describe_batch(batch), exc, exc_info=exc
+                )
+            finally:
+                progress_bar.update(len(batch))
+
+    try:
+        await asyncio.gather(
+            _produce(),
+            *(
+                _consume(queue)
+                for queue, workers in pools.values()
+                for _ in range(workers)
+            ),
+        )
+    finally:
+        progress_bar.close()
+    return converted, skipped, total
+
+
 def main(args: argparse.Namespace) -> int:
 
     # Set input and output paths
-    input_path = Path(args.input)
+    input_paths = [Path(value) for value in args.input]
     output_root = Path(args.output_dir)
 
-    # Validate input file exists
-    if not input_path.exists():
-        logger.error("Input file does not exist: %s", input_path)
+    try:
+        settings = get_settings()
+    except ValueError as exc:
+        logger.error("Invalid configuration: %s", exc)
         return 1
+    concurrency = (
+        args.concurrency if args.concurrency is not None else settings.pdf_concurrency
+    )
+    vision_model = (args.vision_model or settings.vision_model).strip()
+    if vision_model.lower() in {"", "none", "off", "disable"}:
+        vision_model = ""
+
+    # Check credentials before touching the inputs so a run that cannot
+    # succeed fails immediately.
+    required_env = ["MISTRAL_API_KEY"]
+    if vision_model:
+        required_env.append("OPENROUTER_API_KEY")
+    missing_env = [name for name in required_env if not os.environ.get(name)]
+    if missing_env:
+        logger.error("Missing env vars: %s", ", ".join(missing_env))
+        return 3
 
-    if not input_path.is_file():
-        logger.error("Input path is not a file: %s", input_path)
+    # Validate inputs exist
+    missing = [path for path in input_paths if not path.exists()]
+    if missing:
+        for path in missing:
+            logger.error("Input path does not exist: %s", path)
+        return 1
+
+    if concurrency < 1:
+        logger.error("--concurrency must be >= 1.")
+        return 1
+    if settings.pdf_concurrency_large < 1:
+        logger.error("PDF_CONCURRENCY_LARGE must be >= 1.")
+        return 1
+    if settings.ocr_concurrency < 1:
+        logger.error("OCR_CONCURRENCY must be >= 1.")
+        return 1
+    ocr_rps = args.ocr_rps if args.ocr_rps is not None else settings.ocr_rps
+    ocr_max_concurrency = (
+        args.ocr_max_concurrency
+        if args.ocr_max_concurrency is not None
+        else settings.ocr_max_concurrency
+    )
+    if ocr_rps < 0 or ocr_max_concurrency < 0:
+        logger.error("--ocr-rps and --ocr-max-concurrency must be >= 0.")
+        return 1
+    if args.vision_image_max_dim is not None and args.vision_image_max_dim < 0:
+        logger.error("--vision-image-max-dim must be >= 0.")
         return 1
 
-    pdfs = [input_path]
+    max_upload_bytes = (
+        args.max_upload_bytes
+        if args.max_upload_bytes is not None
+        else settings.max_upload_bytes
+    )
 
-    llm_cfg = load_llm_config().get("pdf2markdown", {})
+    # Vision tuning is only parsed when refinement will run, so a malformed
+    # VISION_* value cannot abort an OCR-only run.
+    vision_kwargs: dict[str, object] = {}
+    if vision_model:
+        try:
+            vision = get_vision_settings()
+        except ValueError as exc:
+            logger.error("Invalid configuration: %s", exc)
+            return 1
+        vision_batch_size = (
+            args.vision_batch_size
+            if args.vision_batch_size is not None
+            else vision.batch_size
+        )
+        if vision_batch_size < 2:
+            logger.error("--vision-batch-size / VISION_BATCH_SIZE must be >= 2.")
+            return 1
+        vision_kwargs.update(
+            vision_max_rounds=vision.max_rounds,
+            vision_temperature=(
+                args.vision_temperature
+                if args.vision_temperature is not None
+                else vision.temperature
+            ),
+            vision_max_retries=vision.max_retries,
+            vision_retry_base_delay=vision.retry_base_delay,
+            vision_concurrency=vision.concurrency,
+            vision_image_max_dim=(
+                args.vision_image_max_dim
+                if args.vision_image_max_dim is not None
+                else vision.image_max_dim
+            ),
+            vision_image_detail=vision.image_detail,
+            vision_refine_all=args.vision_refine_all,
+            vision_batch_size=vision_batch_size,
+        )
 
-    ocr_model = (os.environ.get("OCR_MODEL") or llm_cfg.get("ocr_model", "")).strip()
-    vision_model = (args.vision_model or os.environ.get("VISION_MODEL") or llm_cfg.get("model", "")).strip()
-    if vision_model.lower() in {"", "none", "off", "disable"}:
-        vision_model = ""
+    # One client per provider, sharing one httpx pool, for the whole run so
+    # every PDF reuses keep-alive (HTTP/2 when available) connections instead
+    # of paying a new TLS handshake.
+    http_client = create_http_client()
+    try:
+        mistral_client = create_mistral_client(http_client)
+        vision_client = create_vision_client(http_client) if vision_model else None
+    except RuntimeError as exc:
+        http_client.close()
+        logger.error("%s", exc)
+        return 1
 
-    # Load vision refinement parameters from environment variables with defaults
-    vision_max_rounds = int(os.environ.get("VISION_MAX_ROUNDS", "3"))
-    vision_max_retries = int(os.environ.get("VISION_MAX_RETRIES", "3"))
-    vision_retry_base_delay = float(os.environ.get("VISION_RETRY_BASE_DELAY", "2.0"))
-    vision_temperature = float(
-        args.vision_temperature
-        if args.vision_temperature is not None
-        else os.environ.get("VISION_TEMPERATURE", llm_cfg.get("temperature", 0.0))
+    pipeline_kwargs = dict(
+        client=mistral_client,
+        vision_client=vision_client,
+        output_root=output_root,
+        include_images=not args.no_images,
+        ocr_model=settings.ocr_model,
+        save_response=args.save_response,
+        save_page_markdown=True,
+        vision_model=vision_model,
+        # One limiter for the whole run: every OCR request, from any PDF or
+        # page thread, shares the same in-flight cap and start pacing.
+        ocr_rate_limiter=RateLimiter(ocr_rps, ocr_max_concurrency),
+        **vision_kwargs,
     )
 
-    successes = 0
-    logger.info("Found %d PDF(s) to process.", len(pdfs))
-    for pdf in pdfs:
-        logger.info("Processing %s", pdf)
-        try:
-            pdf_to_markdown_pipeline(
-                pdf,
-                output_root,
-                include_images=not args.no_images,
-                ocr_model=ocr_model,
-                save_response=args.save_response,
-                save_page_markdown=True,
-                vision_model=vision_model,
-                vision_max_rounds=vision_max_rounds,
-                vision_temperature=vision_temperature,
-                vision_max_retries=vision_max_retries,
-                vision_retry_base_delay=vision_retry_base_delay,
-                max_upload_bytes=args.max_upload_bytes,
+    convert = partial(
+        _convert_batch,
+        convert_one=partial(
+            pdf_to_markdown_pipeline,
+            max_upload_bytes=max_upload_bytes,
+            ocr_concurrency=settings.ocr_concurrency,
+            **pipeline_kwargs,
+        ),
+        convert_many=partial(pdf_batch_to_markdown_pipeline, **pipeline_kwargs),
+    )
+    convert_with_retry = partial(
+        _convert_with_retry,
+        convert=convert,
+        max_attempts=max(1, settings.pdf_max_retries),
+        base_delay=settings.pdf_retry_base_delay,
+        max_delay=settings.pdf_retry_max_delay,
+        jitter=settings.pdf_retry_jitter,
+    )
+    select_pending = partial(
+        _select_pending,
+        output_root=output_root,
+        ocr_model=settings.ocr_model,
+        vision_model=vision_model,
+        force=args.force,
+    )
+
+    # The output tree holds only generated pages/images; never walk into it.
+    pdfs = _resolve_inputs(input_paths, args.pattern, exclude_dirs=[output_root])
+    batches: Iterable[Sequence[Path]]
+    if args.pack_small_pdfs:
+        # Packing compares sizes across the whole set, so it needs the full list.
+        batches = _pack_pdfs(list(pdfs), max_upload_bytes)
+    else:
+        batches = ([pdf] for pdf in pdfs)
+
+    logger.info(
+        "Converting PDFs from %s (concurrency=%d, large=%d, OCR rps=%s, OCR in flight=%s).",
+        ", ".join(str(path) for path in input_paths),
+        concurrency,
+        settings.pdf_concurrency_large,
+        ocr_rps or "unlimited",
+        ocr_max_concurrency or "unlimited",
+    )
+    try:
+        converted, skipped, total = asyncio.run(
+            _convert_concurrently(
+                batches,
+                convert_with_retry,
+                select_pending,
+                concurrency,
+                is_large=partial(_is_large_batch, max_upload_bytes=max_upload_bytes),
+                large_concurrency=settings.pdf_concurrency_large,
+                progress=args.progress,
             )
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.exception("Failed to convert %s: %s", pdf, exc)
-        else:
-            successes += 1
+        )
+    finally:
+        http_client.close()
+    if not total:
+        logger.error(
+            "No PDFs matching %s found in %s",
+            args.pattern,
+            ", ".join(str(path) for path in input_paths),
+        )
+        return 1
 
-    logger.info("Completed %d/%d conversions.", successes, len(pdfs))
+    successes = converted + skipped
+    logger.info(
+        "Completed %d/%d conversions (%d skipped as unchanged).",
+        successes,
+        total,
+        skipped,
+    )
     return 0 if successes else 2
 
 
@@ -101,7 +531,44 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--input",
-        help="Path to a PDF file or a directory containing PDFs.",
+        nargs="+",
+        required=True,
+        help="One or more PDF files or directories containing PDFs.",
+    )
+    parser.add_argument(
+        "--pattern",
+        default="*.pdf",
+        help="Glob used to find PDFs (recursively) when --input is a directory (default: *.pdf).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Number of PDFs converted concurrently (default: env PDF_CONCURRENCY or 4).",
+    )
+    parser.add_argument(
+        "--ocr-rps",
+        type=float,
+        default=None,
+        help=(
+            "Maximum OCR requests started per second across all PDFs and split pages "
+            "(default: env OCR_RPS or 0 = unlimited)."
+        ),
+    )
+    parser.add_argument(
+        "--ocr-max-concurrency",
+        type=int,
+        default=None,
+        help=(
+            "Maximum OCR requests in flight across all PDFs and split pages "
+            "(default: env OCR_MAX_CONCURRENCY or 0 = unlimited)."
+        ),
+    )
+    parser.add_argument(
+        "--progress",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Show a progress bar instead of per-PDF log lines (use --no-progress for CI logs).",
     )
     parser.add_argument(
         "--output-dir",
@@ -121,11 +588,24 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--max-upload-bytes",
         type=int,
-        default=int(os.environ.get("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024))),
+        default=None,
         help=(
             "Maximum PDF size (bytes) to send in a single OCR request before splitting per page "
-            "(default: 10485760). Smaller values reduce per-request payload and enable parallel "
-            "processing (up to 3 requests)."
+            "(default: env MAX_UPLOAD_BYTES or 10485760). Larger PDFs are OCR'd one request per page, "
+            "up to OCR_CONCURRENCY (default 16) pages in parallel."
+        ),
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Convert every PDF even if an output with a matching .fingerprint already exists.",
+    )
+    parser.add_argument(
+        "--pack-small-pdfs",
+        action="store_true",
+        help=(
+            "Merge small PDFs into a single OCR request up to --max-upload-bytes and split "
+            "the result back per PDF (fewer round-trips for many small documents)."
         ),
     )
     parser.add_argument(
@@ -139,6 +619,33 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Override vision temperature (defaults to llm_config.yml pdf2markdown.temperature).",
     )
+    parser.add_argument(
+        "--vision-image-max-dim",
+        type=int,
+        default=None,
+        help=(
+            "Downscale page images to this many pixels on the long edge before sending them "
+            "to the vision model (default: env VISION_IMAGE_MAX_DIM or 1600; 0 = full size)."
+        ),
+    )
+    parser.add_argument(
+        "--vision-batch-size",
+        type=int,
+        default=None,
+        help=(
+            "Consecutive pages refined per vision request; neighbouring windows share one "
+            "page (default: env VISION_BATCH_SIZE or 2)."
+        ),
+    )
+    parser.add_argument(
+        "--vision-refine-all",
+        action="store_true",
+        help=(
+            "Refine every page window with the vision model. By default windows whose pages "
+            "pass a cheap OCR quality check (no images or figures, no replacement/control "
+            "characters, table rows matching their header's cell count) are skipped."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -1,16 +1,59 @@
 """Utilities for the pdf2markdown toolchain."""
 
-from pdf2markdown.utils.clients import create_mistral_client, create_vision_client
+from pdf2markdown.utils.clients import (
+    create_mistral_client,
+    create_vision_client,
+    get_mistral_client,
+    get_vision_client,
+)
+from pdf2markdown.utils.fingerprint import (
+    compute_fingerprint,
+    find_matching_output,
+    write_fingerprint,
+)
+from pdf2markdown.utils.http_client import create_http_client
 from pdf2markdown.utils.markdown_utils import normalize_toc_markdown
-from pdf2markdown.utils.pdf_to_markdown_pipeline import pdf_to_markdown_pipeline
+from pdf2markdown.utils.pdf_to_markdown_pipeline import (
+    pdf_batch_to_markdown_pipeline,
+    pdf_to_markdown_pipeline,
+)
+from pdf2markdown.utils.rate_limiter import RateLimiter
+from pdf2markdown.utils.retry_utils import (
+    backoff_delay,
+    is_rate_limit_error,
+    is_transient_http_error,
+    retry_with_backoff,
+)
+from pdf2markdown.utils.settings import (
+    PdfToMarkdownSettings,
+    VisionSettings,
+    get_settings,
+    get_vision_settings,
+)
 from pdf2markdown.utils.create_mistral_client import create_mistral_client as mistral_client_factory
 from pdf2markdown.utils.create_vision_client import create_vision_client as vision_client_factory
 
 __all__ = [
     "create_mistral_client",
     "create_vision_client",
+    "get_mistral_client",
+    "get_vision_client",
+    "create_http_client",
+    "compute_fingerprint",
+    "find_matching_output",
+    "write_fingerprint",
     "normalize_toc_markdown",
     "pdf_to_markdown_pipeline",
+    "pdf_batch_to_markdown_pipeline",
+    "RateLimiter",
+    "backoff_delay",
+    "is_rate_limit_error",
+    "is_transient_http_error",
+    "retry_with_backoff",
+    "PdfToMarkdownSettings",
+    "get_settings",
+    "VisionSettings",
+    "get_vision_settings",
     "mistral_client_factory",
     "vision_client_factory",
 ]
@@ -1,19 +1,66 @@
 """PDF2Markdown client factories (Mistral OCR + OpenRouter vision)."""
 
 import os
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+from mistralai import Mistral
 from openai import OpenAI
 
 from pdf2markdown.utils.create_mistral_client import create_mistral_client
 
 
-def create_vision_client() -> OpenAI:
-    """Create an OpenRouter-compatible OpenAI client for vision refinement."""
+def create_vision_client(http_client: Optional[httpx.Client] = None) -> OpenAI:
+    """Create an OpenRouter-compatible OpenAI client for vision refinement.
+
+    Pass a shared http_client (see create_http_client) to reuse its connection pool.
+    """
     key = os.environ.get("OPENROUTER_API_KEY")
     if not key:
         raise RuntimeError("Missing OpenRouter API key. Set OPENROUTER_API_KEY.")
     base_url = os.environ.get("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
     default_headers = {"HTTP-Referer": "https://github.com/docling/pdf-ocr-refinement"}
-    return OpenAI(api_key=key, base_url=base_url, default_headers=default_headers)
+    return OpenAI(
+        api_key=key,
+        base_url=base_url,
+        default_headers=default_headers,
+        http_client=http_client,
+    )
+
+
+# The key/base URL arguments only key the cache; the factories read the same
+# environment variables, so a rotated key builds a fresh client.
+@lru_cache(maxsize=4)
+def _cached_mistral_client(api_key: str) -> Mistral:
+    return create_mistral_client()
+
+
+@lru_cache(maxsize=4)
+def _cached_vision_client(api_key: str, base_url: str) -> OpenAI:
+    return create_vision_client()
+
+
+def get_mistral_client() -> Mistral:
+    """Return a process-wide Mistral client, reused while MISTRAL_API_KEY is unchanged.
+
+    Library callers that do not inject a client share one SDK connection pool
+    across pipeline calls instead of opening a new one per PDF.
+    """
+    return _cached_mistral_client(os.environ.get("MISTRAL_API_KEY", ""))
+
+
+def get_vision_client() -> OpenAI:
+    """Return a process-wide vision client, keyed on the OpenRouter key and base URL."""
+    return _cached_vision_client(
+        os.environ.get("OPENROUTER_API_KEY", ""),
+        os.environ.get("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
+    )
 
 
-__all__ = ["create_mistral_client", "create_vision_client"]
+__all__ = [
+    "create_mistral_client",
+    "create_vision_client",
+    "get_mistral_client",
+    "get_vision_client",
+]
@@ -1,16 +1,23 @@
 """Utility function to create a Mistral client."""
 
 import os
+from typing import Optional
+
+import httpx
 from mistralai import Mistral
 
 
-def create_mistral_client() -> Mistral:
+def create_mistral_client(http_client: Optional[httpx.Client] = None) -> Mistral:
     """Create and return a Mistral client using the MISTRAL_API_KEY environment variable.
 
     The API key is loaded from the MISTRAL_API_KEY environment variable.
     This function should be called after load_dotenv() has been executed to ensure
     the environment variable is available.
 
+    Args:
+        http_client: Optional shared httpx client (see create_http_client) so the
+            SDK reuses one connection pool.
+
     Returns:
         Mistral: Initialized Mistral client instance.
 
@@ -27,4 +34,4 @@ def create_mistral_client() -> Mistral:
         raise RuntimeError(
             "Missing Mistral API key. Set the MISTRAL_API_KEY environment variable."
         )
-    return Mistral(api_key=key)
+    return Mistral(api_key=key, client=http_client)
@@ -1,11 +1,17 @@
 """OpenRouter-only client for vision refinement."""
 
 import os
+from typing import Optional
+
+import httpx
 from openai import OpenAI
 
 
-def create_vision_client() -> OpenAI:
-    """Create an OpenRouter-compatible OpenAI client for vision refinement."""
+def create_vision_client(http_client: Optional[httpx.Client] = None) -> OpenAI:
+    """Create an OpenRouter-compatible OpenAI client for vision refinement.
+
+    Pass a shared http_client (see create_http_client) to reuse its connection pool.
+    """
     key = os.environ.get("OPENROUTER_API_KEY")
     if not key:
         raise RuntimeError("Missing OpenRouter API key. Set OPENROUTER_API_KEY.")
@@ -17,4 +23,5 @@ def create_vision_client() -> OpenAI:
         api_key=key,
         base_url=resolved_base_url,
         default_headers=default_headers,
+        http_client=http_client,
     )
@@ -0,0 +1,44 @@
+"""Conversion fingerprints used to skip PDFs that were already converted."""
+
+import glob
+import hashlib
+from pathlib import Path
+
+FINGERPRINT_FILENAME = ".fingerprint"
+
+
+def compute_fingerprint(pdf_path: Path, ocr_model: str, vision_model: str) -> str:
+    """Hash the PDF bytes (streamed) together with the models that produce the output."""
+    with pdf_path.open("rb") as handle:
+        digest = hashlib.file_digest(handle, lambda: hashlib.blake2b(digest_size=16))
+    digest.update(b"\0" + ocr_model.encode("utf-8"))
+    digest.update(b"\0" + vision_model.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def find_matching_output(output_root: Path, pdf_path: Path, fingerprint: str) -> Path | None:
+    """Return an existing `<timestamp>_<stem>` output directory with the same fingerprint."""
+    if not output_root.is_dir():
+        return None
+    for document_dir in sorted(output_root.glob(f"*_{glob.escape(pdf_path.stem)}"), reverse=True):
+        # Directory names are "<YYYYmmdd>_<HHMMSS>[-N]_<stem>".
+        if document_dir.name.split("_", 2)[-1] != pdf_path.stem:
+            continue
+        marker = document_dir / FINGERPRINT_FILENAME
+        if not (document_dir / "combined_markdown.md").is_file() or not marker.is_file():
+            continue
+        if marker.read_text(encoding="utf-8").strip() == fingerprint:
+            return document_dir
+    return None
+
+
+def write_fingerprint(document_dir: Path, fingerprint: str) -> None:
+    (document_dir / FINGERPRINT_FILENAME).write_text(fingerprint, encoding="utf-8")
+
+
+__all__ = [
+    "FINGERPRINT_FILENAME",
+    "compute_fingerprint",
+    "find_matching_output",
+    "write_fingerprint",
+]
@@ -0,0 +1,25 @@
+"""Shared HTTP connection pool for the Mistral and OpenRouter SDK clients."""
+
+import importlib.util
+
+import httpx
+
+
+def create_http_client(max_connections: int = 32) -> httpx.Client:
+    """Create a pooled httpx client to inject into both SDKs.
+
+    HTTP/2 is enabled when the `h2` package is installed (httpx[http2]) so
+    concurrent OCR/vision calls multiplex over one TLS connection per host;
+    otherwise the pool falls back to HTTP/1.1 keep-alive connections.
+    """
+    return httpx.Client(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_keepalive_connections=max_connections,
+            max_connections=max_connections,
+        ),
+        timeout=httpx.Timeout(300.0, connect=10.0),
+    )
+
+
+__all__ = ["create_http_client"]
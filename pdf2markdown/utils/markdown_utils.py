@@ -3,6 +3,8 @@
 import re
 from typing import Iterable
 
+_TOC_LINE_RE = re.compile(r"^\s*[\d\.\-]*\s*(.+)$")
+
 
 def _collapse_blank_lines(lines: Iterable[str]) -> list[str]:
     """Collapse sequences of blank lines to a maximum of one."""
@@ -28,9 +30,8 @@ def normalize_toc_markdown(text: str) -> str:
     lines = [line.rstrip() for line in text.replace("\r\n", "\n").split("\n")]
 
     normalized: list[str] = []
-    toc_pattern = re.compile(r"^\s*[\d\.\-]*\s*(.+)$")
     for line in lines:
-        match = toc_pattern.match(line)
+        match = _TOC_LINE_RE.match(line)
         normalized.append(match.group(1) if match else line)
 
     normalized = _collapse_blank_lines(normalized)
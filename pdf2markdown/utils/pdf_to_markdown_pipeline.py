@@ -1,16 +1,23 @@
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Sequence, TypeVar
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from openai import OpenAI
-from pdf2markdown.utils.clients import create_mistral_client, create_vision_client
+from pdf2markdown.utils.clients import get_mistral_client, get_vision_client
 import logging
 import base64
+import io
 from pdf2markdown.utils.markdown_utils import normalize_toc_markdown
+from pdf2markdown.utils.rate_limiter import RateLimiter
+from pdf2markdown.utils.retry_utils import is_transient_http_error, retry_with_backoff
 from mistralai import Mistral
 import time
 import httpx
 import json
+import orjson
 
 from openai import (
     APIConnectionError,
@@ -21,10 +28,19 @@ from openai import (
 )
 import difflib
 import re
-import tempfile
+import shutil
+
+if TYPE_CHECKING:
+    import pikepdf
+    from pypdf import PdfReader
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+_EXCESS_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
 
 class VisionRefinementError(RuntimeError):
     """Raised when the vision refinement step fails and should abort the pipeline."""
@@ -38,27 +54,44 @@ def _extract_attr(
     return getattr(entry, name, default)
 
 
-def _encode_pdf(pdf_path: Path) -> str:
-    data = pdf_path.read_bytes()
+def _encode_pdf_bytes(data: bytes) -> str:
     encoded = base64.b64encode(data).decode("utf-8")
     return f"data:application/pdf;base64,{encoded}"
 
 
+_ENCODE_BLOCK_BYTES = 57 * 1024  # multiple of 3, so per-block base64 has no padding
+
+
+def _encode_pdf(pdf_path: Path) -> str:
+    # Encode block by block into a buffer that already holds the data-URL
+    # prefix, so the raw file is never held alongside its full base64 copy
+    # and the only other full copy is the single decode at the end.
+    encoded = bytearray(b"data:application/pdf;base64,")
+    with pdf_path.open("rb") as handle:
+        while block := handle.read(_ENCODE_BLOCK_BYTES):
+            encoded += base64.b64encode(block)
+    return encoded.decode("ascii")
+
+
 def _persist_response(content: object, target_dir: Path) -> None:
     json_path = target_dir / "mistral_response.json"
     try:
-        json_payload = json.dumps(content, indent=2)
+        json_payload = orjson.dumps(content, option=orjson.OPT_INDENT_2)
     except TypeError:
         if hasattr(content, "model_dump"):
-            json_payload = json.dumps(content.model_dump(), indent=2)  # type: ignore[attr-defined]
+            json_payload = orjson.dumps(content.model_dump(), option=orjson.OPT_INDENT_2)  # type: ignore[attr-defined]
         elif hasattr(content, "to_dict"):
-            json_payload = json.dumps(content.to_dict(), indent=2)  # type: ignore[attr-defined]
+            json_payload = orjson.dumps(content.to_dict(), option=orjson.OPT_INDENT_2)  # type: ignore[attr-defined]
         else:
             raise RuntimeError("Unable to serialise Mistral OCR response to JSON.")
-    json_path.write_text(json_payload, encoding="utf-8")
+    json_path.write_bytes(json_payload)
+
 
+def _write_unified_diff(before: str, after: str, diff_path: Path) -> bool:
+    """Stream the unified diff of before -> after into diff_path.
 
-def _render_unified_diff(before: str, after: str) -> str:
+    Returns False (and creates no file) when the diff is empty.
+    """
     diff_lines = difflib.unified_diff(
         before.splitlines(),
         after.splitlines(),
@@ -66,7 +99,49 @@ def _render_unified_diff(before: str, after: str) -> str:
         tofile="after.md",
         lineterm="",
     )
-    return "\n".join(diff_lines)
+    first_line = next(diff_lines, None)
+    if first_line is None:
+        return False
+    with diff_path.open("w", encoding="utf-8") as handle:
+        handle.write(first_line)
+        for line in diff_lines:
+            handle.write("\n")
+            handle.write(line)
+    return True
+
+
+def _shrink_image_b64(image_b64: str, max_dim: int = 1600, quality: int = 80) -> str:
+    """Downscale a base64 page image to max_dim on its long edge and re-encode as JPEG.
+
+    Returns the input unchanged when max_dim <= 0, the image already fits, or
+    it cannot be decoded.
+    """
+    if max_dim <= 0:
+        return image_b64
+    try:
+        from PIL import Image  # type: ignore[import]
+    except ImportError:  # pragma: no cover - optional dependency
+        logger.debug("Pillow not installed; sending page images at full resolution.")
+        return image_b64
+
+    try:
+        with Image.open(io.BytesIO(base64.b64decode(image_b64))) as image:
+            if max(image.size) <= max_dim:
+                return image_b64
+            image.thumbnail((max_dim, max_dim), Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.convert("RGB").save(buffer, format="JPEG", quality=quality)
+    except Exception as exc:
+        logger.debug("Unable to downscale page image (%s); sending original.", exc)
+        return image_b64
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def _shrink_page_image(page: object, max_dim: int) -> Optional[str]:
+    image_b64 = _extract_attr(page, "image_base64")
+    if not isinstance(image_b64, str) or not image_b64:
+        return None
+    return _shrink_image_b64(image_b64, max_dim)
 
 
 def _sanitize_markdown_from_tool(text: str) -> str:
@@ -79,7 +154,7 @@ def _sanitize_markdown_from_tool(text: str) -> str:
         sanitized.replace("\\r\\n", "\n").replace("\\n", "\n").replace("\\t", "\t")
     )
     # Collapse excessive blank lines
-    sanitized = re.sub(r"\n{3,}", "\n\n", sanitized)
+    sanitized = _EXCESS_BLANK_LINES_RE.sub("\n\n", sanitized)
     return sanitized
 
 
@@ -87,45 +162,80 @@ def _should_split_document(pdf_path: Path, max_upload_bytes: int) -> bool:
     return max_upload_bytes > 0 and pdf_path.stat().st_size > max_upload_bytes
 
 
-def _prepare_pdf_page_chunks(pdf_path: Path):
-    """
-    Context manager that creates temporary PDF files for each page.
-    Yields a list of (page_index, chunk_path) tuples.
-    The temporary directory is kept alive until the context manager exits.
+def _open_pdf_source(pdf_path: Path) -> "pikepdf.Pdf | PdfReader":
+    """Open pdf_path for per-page splitting.
+
+    pikepdf (libqpdf) is used when installed since it writes single-page PDFs
+    much faster than pure-Python pypdf; pypdf is the fallback. Both objects
+    are context managers exposing .pages.
     """
     try:
-        from pypdf import PdfReader, PdfWriter  # type: ignore[import]
+        import pikepdf  # type: ignore[import]
+    except ImportError:
+        pass
+    else:
+        return pikepdf.open(pdf_path)
+    try:
+        from pypdf import PdfReader  # type: ignore[import]
     except ImportError as exc:  # pragma: no cover - optional dependency
         raise RuntimeError(
-            "Splitting large PDFs requires the 'pypdf' package. "
-            "Install it with `pip install pypdf` or increase --max-upload-bytes."
+            "Splitting large PDFs requires the 'pikepdf' or 'pypdf' package. "
+            "Install one with `pip install pikepdf` or increase --max-upload-bytes."
         ) from exc
+    return PdfReader(str(pdf_path))
+
+
+def _iter_pdf_page_payloads(
+    source: "pikepdf.Pdf | PdfReader",
+) -> Iterator[tuple[int, str]]:
+    """Yield (page_index, data_url) for each page cut into its own in-memory PDF.
+
+    The source PDF is parsed once; every single-page PDF is written to a
+    BytesIO and encoded directly, without temporary files.
+    """
+    try:
+        import pikepdf  # type: ignore[import]
+    except ImportError:
+        pikepdf = None
+
+    for page_index, page in enumerate(source.pages):
+        buffer = io.BytesIO()
+        if pikepdf is not None and isinstance(source, pikepdf.Pdf):
+            with pikepdf.Pdf.new() as writer:
+                writer.pages.append(page)
+                writer.save(buffer)
+        else:
+            from pypdf import PdfWriter  # type: ignore[import]
+
+            writer = PdfWriter()
+            writer.add_page(page)
+            writer.write(buffer)
+        yield page_index, _encode_pdf_bytes(buffer.getvalue())
+
+
+def _map_bounded(
+    executor: ThreadPoolExecutor,
+    fn: Callable[[T], R],
+    items: Iterator[T],
+    window: int,
+) -> Iterator[R]:
+    """Like executor.map, but only pulls window items ahead of the consumer.
 
-    class ChunksContextManager:
-        def __init__(self, pdf_path: Path):
-            self.pdf_path = pdf_path
-            self.tmpdir = None
-            self.chunks = []
-
-        def __enter__(self):
-            self.tmpdir = tempfile.TemporaryDirectory()
-            tmpdir_path = Path(self.tmpdir.__enter__())
-            reader = PdfReader(str(self.pdf_path))
-            for page_index, page in enumerate(reader.pages):
-                writer = PdfWriter()
-                writer.add_page(page)
-                chunk_path = tmpdir_path / f"page-{page_index + 1:04d}.pdf"
-                with chunk_path.open("wb") as handle:
-                    writer.write(handle)
-                self.chunks.append((page_index, chunk_path))
-            return self.chunks
-
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            if self.tmpdir:
-                self.tmpdir.__exit__(exc_type, exc_val, exc_tb)
-            return False
-
-    return ChunksContextManager(pdf_path)
+    executor.map drains its input up front, which for page payloads means
+    every base64-encoded page would sit in memory at once. Results are
+    yielded in input order; pending futures are cancelled on early exit.
+    """
+    pending: deque[Future[R]] = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
 
 
 def _normalise_page_entry(page: object) -> dict[str, Optional[object]]:
@@ -136,49 +246,108 @@ def _normalise_page_entry(page: object) -> dict[str, Optional[object]]:
     }
 
 
+# Built once at import; these checks run on every failed request.
+_NONRETRYABLE_VISION_TYPES = (AuthenticationError,)
+_RETRYABLE_VISION_TYPES = (
+    RateLimitError,
+    APIConnectionError,
+    APITimeoutError,
+    TimeoutError,
+    ConnectionError,
+    httpx.ConnectError,
+    httpx.ReadTimeout,
+    httpx.WriteTimeout,
+    httpx.PoolTimeout,
+    httpx.RemoteProtocolError,
+)
+_RETRYABLE_OCR_TYPES = (
+    TimeoutError,
+    ConnectionError,
+    httpx.RemoteProtocolError,
+    httpx.ConnectError,
+    httpx.ReadTimeout,
+    httpx.WriteTimeout,
+    httpx.PoolTimeout,
+    httpx.ReadError,  # SSL and network read errors
+)
+
+
 def _is_retryable_vision_error(exc: Exception) -> bool:
-    if AuthenticationError is not None and isinstance(exc, AuthenticationError):
+    if isinstance(exc, _NONRETRYABLE_VISION_TYPES):
         return False
 
     status_code = getattr(exc, "status_code", None)
     if status_code in (401, 403):
         return False
 
-    if RateLimitError is not None and isinstance(exc, RateLimitError):
-        return True
-    if APIConnectionError is not None and isinstance(exc, APIConnectionError):
-        return True
-    if APITimeoutError is not None and isinstance(exc, APITimeoutError):
+    if isinstance(exc, _RETRYABLE_VISION_TYPES):
         return True
 
-    if APIStatusError is not None and isinstance(exc, APIStatusError):
-        if status_code is None:
-            status_code = exc.status_code  # type: ignore[attr-defined]
+    if isinstance(exc, APIStatusError):
         if status_code is not None:
-            if status_code == 429 or 500 <= status_code < 600:
-                return True
-            return False
-
-    retryable_types = (TimeoutError, ConnectionError)
-    if isinstance(exc, retryable_types):
-        return True
+            return status_code == 429 or 500 <= status_code < 600
+    return False
 
-    if httpx is not None and isinstance(
-        exc,
-        (
-            httpx.ConnectError,
-            httpx.ReadTimeout,
-            httpx.WriteTimeout,
-            httpx.PoolTimeout,
-            httpx.RemoteProtocolError,
-        ),
-    ):
-        return True
 
-    return False
+_VISION_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "apply_page_group_edits",
+            "description": (
+                "Submit revised Markdown for one or more pages in the current group when changes are required."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "updated_pages": {
+                        "type": "array",
+                        "description": "List of per-page Markdown updates.",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "page_number": {
+                                    "type": "integer",
+                                    "description": "The page number being updated.",
+                                },
+                                "updated_markdown": {
+                                    "type": "string",
+                                    "description": "The fully updated Markdown representation for the page.",
+                                },
+                                "notes": {
+                                    "type": "string",
+                                    "description": "Brief summary of the applied fixes.",
+                                },
+                            },
+                            "required": ["page_number", "updated_markdown"],
+                        },
+                    },
+                },
+                "required": ["updated_pages"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "approve_page_group",
+            "description": "Call when the Markdown accurately reflects the page content.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "justification": {
+                        "type": "string",
+                        "description": "Explain why no further edits are necessary.",
+                    }
+                },
+            },
+        },
+    },
+]
 
 
-def _build_vision_prompt(page_numbers: Sequence[int]) -> str:
+@lru_cache(maxsize=256)
+def _build_vision_prompt(page_numbers: tuple[int, ...]) -> str:
     if not page_numbers:
         page_label = "the provided page(s)"
     elif len(page_numbers) == 1:
@@ -197,7 +366,7 @@ def _build_vision_prompt(page_numbers: Sequence[int]) -> str:
         "Do not remove or truncate content that plausibly continues across the page boundary "
         "(e.g., hyphenated words, continued lists, or tables). If uncertain, prefer preserving and continuing "
         "the structure rather than deleting lines. Ensure that table rows and paragraphs that cross page "
-        "boundaries remain contiguous and consistent across both pages. "
+        "boundaries remain contiguous and consistent across the pages. "
         "Return Markdown with actual newline characters (no literal \\n sequences)."
     )
 
@@ -214,75 +383,36 @@ def _refine_page_group_with_vision(
     temperature: float,
     max_attempts: int,
     retry_base_delay: float,
+    image_detail: str = "auto",
 ) -> list[str]:
     if not original_markdowns:
         return []
 
     current_markdowns = list(original_markdowns)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    system_prompt = _build_vision_prompt(page_numbers)
-
-    tools = [
-        {
-            "type": "function",
-            "function": {
-                "name": "apply_page_group_edits",
-                "description": (
-                    "Submit revised Markdown for one or more pages in the current group when changes are required."
-                ),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "updated_pages": {
-                            "type": "array",
-                            "description": "List of per-page Markdown updates.",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "page_number": {
-                                        "type": "integer",
-                                        "description": "The page number being updated.",
-                                    },
-                                    "updated_markdown": {
-                                        "type": "string",
-                                        "description": "The fully updated Markdown representation for the page.",
-                                    },
-                                    "notes": {
-                                        "type": "string",
-                                        "description": "Brief summary of the applied fixes.",
-                                    },
-                                },
-                                "required": ["page_number", "updated_markdown"],
-                            },
-                        },
-                    },
-                    "required": ["updated_pages"],
-                },
-            },
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "approve_page_group",
-                "description": "Call when the Markdown accurately reflects the page content.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "justification": {
-                            "type": "string",
-                            "description": "Explain why no further edits are necessary.",
-                        }
-                    },
+    system_prompt = _build_vision_prompt(tuple(page_numbers))
+    # page_numbers is fixed for the whole group, so map and label it once.
+    number_to_index = {number: idx for idx, number in enumerate(page_numbers)}
+    page_label = ", ".join(str(number) for number in page_numbers)
+    # Image parts are identical in every round, so build the data URLs once.
+    image_parts: list[Optional[dict[str, object]]] = [
+        (
+            {
+                "type": "image_url",
+                "image_url": {
+                    "url": f"data:image/jpeg;base64,{image_b64}",
+                    "detail": image_detail,
                 },
-            },
-        },
+            }
+            if image_b64
+            else None
+        )
+        for image_b64 in images_b64
     ]
 
     for round_index in range(1, max_rounds + 1):
         if not any(markdown.strip() for markdown in current_markdowns):
             return current_markdowns
 
-        page_label = ", ".join(str(number) for number in page_numbers)
         round_t0 = time.perf_counter()
         logger.info(
             "Pages %s round %d: requesting vision refinement", page_label, round_index
@@ -291,24 +421,17 @@ def _refine_page_group_with_vision(
             {
                 "type": "text",
                 "text": (
-                    "You are provided with one or two consecutive PDF page transcriptions. "
+                    "You are provided with consecutive PDF page transcriptions. "
                     "Compare them with the corresponding page images and correct any mistakes, "
-                    "keeping tables and sentences continuous when they span both pages."
+                    "keeping tables and sentences continuous when they span page boundaries."
                 ),
             }
         ]
 
         for idx, page_number in enumerate(page_numbers):
-            image_b64 = images_b64[idx] if idx < len(images_b64) else None
-            if image_b64:
-                user_content.append(
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:image/jpeg;base64,{image_b64}",
-                        },
-                    }
-                )
+            image_part = image_parts[idx] if idx < len(image_parts) else None
+            if image_part is not None:
+                user_content.append(image_part)
             current_markdown = (
                 current_markdowns[idx] if idx < len(current_markdowns) else ""
             )
@@ -323,33 +446,24 @@ def _refine_page_group_with_vision(
             {"role": "system", "content": [{"type": "text", "text": system_prompt}]},
             {"role": "user", "content": user_content},
         ]
-        response = None
-        for attempt in range(1, max_attempts + 1):
-            try:
-                response = client.chat.completions.create(
+        try:
+            response = retry_with_backoff(
+                lambda: client.chat.completions.create(
                     model=model,
                     messages=messages,
-                    tools=tools,
+                    tools=_VISION_TOOLS,
                     tool_choice="required",
                     temperature=temperature,
-                )
-            except Exception as exc:  # pragma: no cover - defensive
-                if not _is_retryable_vision_error(exc) or attempt >= max_attempts:
-                    raise VisionRefinementError(
-                        f"Vision refinement failed after {attempt} attempt(s) for pages {page_label}."
-                    ) from exc
-                wait = max(retry_base_delay, 0.0) * attempt
-                logger.warning(
-                    "Vision refinement request failed (%s) for pages %s. Retrying in %.1f seconds (%d/%d).",
-                    exc.__class__.__name__,
-                    page_label,
-                    wait,
-                    attempt,
-                    max_attempts,
-                )
-                time.sleep(wait)
-            else:
-                break
+                ),
+                is_retryable=_is_retryable_vision_error,
+                max_attempts=max_attempts,
+                base_delay=retry_base_delay,
+                description=f"Vision refinement request for pages {page_label}",
+            )
+        except Exception as exc:
+            raise VisionRefinementError(
+                f"Vision refinement failed after retries for pages {page_label}."
+            ) from exc
         if response is None:  # pragma: no cover - defensive
             logger.warning(
                 "Vision refinement failed for pages %s with no response; using original markdown.",
@@ -381,6 +495,7 @@ def _refine_page_group_with_vision(
             )
             break
 
+        edits_received = changed_in_round = False
         for tool_call in assistant_message.tool_calls:
             tool_name = tool_call.function.name
             try:
@@ -402,9 +517,6 @@ def _refine_page_group_with_vision(
                     )
                     continue
 
-                number_to_index = {
-                    number: idx for idx, number in enumerate(page_numbers)
-                }
                 for entry in updated_pages:
                     if not isinstance(entry, dict):
                         continue
@@ -430,20 +542,22 @@ def _refine_page_group_with_vision(
                         )
                         continue
                     previous_markdown = current_markdowns[target_idx]
-                    diff_text = _render_unified_diff(
-                        previous_markdown, sanitized_markdown
+                    edits_received = True
+                    if sanitized_markdown == previous_markdown:
+                        continue
+                    changed_in_round = True
+                    # Include the window context in the filename to avoid overwriting diffs
+                    if len(page_numbers) >= 2:
+                        pair_label = f"{page_numbers[0]:04d}-{page_numbers[-1]:04d}"
+                    else:
+                        pair_label = f"{page_numbers[0]:04d}"
+                    diff_path: Optional[Path] = output_dir / (
+                        f"page-{page_number:04d}-pair-{pair_label}-round-{round_index}.diff"
                     )
-                    diff_path = None
-                    if diff_text:
-                        # Include the pair context in the filename to avoid overwriting diffs
-                        if len(page_numbers) >= 2:
-                            pair_label = f"{page_numbers[0]:04d}-{page_numbers[1]:04d}"
-                        else:
-                            pair_label = f"{page_numbers[0]:04d}"
-                        diff_path = output_dir / (
-                            f"page-{page_number:04d}-pair-{pair_label}-round-{round_index}.diff"
-                        )
-                        diff_path.write_text(diff_text, encoding="utf-8")
+                    if not _write_unified_diff(
+                        previous_markdown, sanitized_markdown, diff_path
+                    ):
+                        diff_path = None
                     logger.debug(
                         "Applied vision refinement round %d for page %d. Diff saved to %s",
                         round_index,
@@ -469,6 +583,15 @@ def _refine_page_group_with_vision(
             page_label,
             round_elapsed,
         )
+        if edits_received and not changed_in_round:
+            # Edits identical to the current text: another round would only
+            # re-send the same images and Markdown.
+            logger.debug(
+                "Vision refinement round %d made no changes for pages %s; stopping.",
+                round_index,
+                page_label,
+            )
+            return current_markdowns
 
     logger.info(
         "Vision refinement reached max rounds (%d) for pages %s without explicit approval.",
@@ -479,38 +602,22 @@ def _refine_page_group_with_vision(
 
 
 def _is_retryable_ocr_error(exc: Exception) -> bool:
-    retryable_types = (
-        TimeoutError,
-        ConnectionError,
-    )
-    if isinstance(exc, retryable_types):
-        return True
-    if httpx is not None:
-        retryable_httpx = (
-            httpx.RemoteProtocolError,
-            httpx.ConnectError,
-            httpx.ReadTimeout,
-            httpx.WriteTimeout,
-            httpx.PoolTimeout,
-            httpx.ReadError,  # SSL and network read errors
-        )
-        if isinstance(exc, retryable_httpx):
-            return True
-    return False
+    return isinstance(exc, _RETRYABLE_OCR_TYPES) or is_transient_http_error(exc)
 
 
 def _process_pdf_chunk(
     *,
     local_page_index: int,
-    chunk_path: Path,
+    document_url: str,
     client: Mistral,
     include_images: bool,
     ocr_model: str,
+    rate_limiter: Optional[RateLimiter] = None,
 ) -> tuple[int, object, list[dict[str, Optional[object]]]]:
     """Process a single PDF chunk and return (page_index, response, normalized_pages)."""
     document_payload = {
         "type": "document_url",
-        "document_url": _encode_pdf(chunk_path),
+        "document_url": document_url,
     }
     t0 = time.perf_counter()
     chunk_response = _request_mistral_ocr(
@@ -518,6 +625,7 @@ def _process_pdf_chunk(
         document_payload=document_payload,
         include_images=include_images,
         ocr_model=ocr_model,
+        rate_limiter=rate_limiter,
     )
     elapsed = time.perf_counter() - t0
     logger.info(
@@ -532,81 +640,260 @@ def _process_pdf_chunk(
     return local_page_index, chunk_response, normalised_pages
 
 
-def _apply_pairwise_vision_refinement(
-    pages: Sequence[dict[str, Optional[object]]],
-    *,
-    client: OpenAI,
-    model: str,
-    output_dir: Path,
-    max_rounds: int,
-    temperature: float,
-    max_attempts: int,
-    retry_base_delay: float,
-) -> None:
-    if not pages or len(pages) < 2:
-        return
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+_MARKDOWN_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_UNESCAPED_PIPE_RE = re.compile(r"(?<!\\)\|")
+_TABLE_DELIMITER_RE = re.compile(r"^\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?$")
 
-    total_pages = len(pages)
-    for i in range(total_pages - 1):
-        # Sliding window of consecutive pages: [i, i+1] => page numbers [i+1, i+2]
-        left_entry = pages[i]
-        right_entry = pages[i + 1]
-        page_numbers = [i + 1, i + 2]
 
-        original_markdowns = [
-            (_extract_attr(left_entry, "markdown", "") or ""),
-            (_extract_attr(right_entry, "markdown", "") or ""),
-        ]
-        images_b64 = [
-            _extract_attr(left_entry, "image_base64"),
-            _extract_attr(right_entry, "image_base64"),
-        ]
+def _count_table_cells(row: str) -> int:
+    """Count the cells of a Markdown table row; outer pipes are optional and escaped pipes are text."""
+    stripped = row.strip()
+    if stripped.startswith("|"):
+        stripped = stripped[1:]
+    if stripped.endswith("|") and not stripped.endswith("\\|"):
+        stripped = stripped[:-1]
+    return len(_UNESCAPED_PIPE_RE.split(stripped))
 
-        # Skip windows that contain no text content at all
-        if not any(markdown.strip() for markdown in original_markdowns):
-            continue
 
-        win_t0 = time.perf_counter()
-        updated_markdowns = _refine_page_group_with_vision(
-            client=client,
-            model=model,
-            page_numbers=page_numbers,
-            original_markdowns=original_markdowns,
-            images_b64=images_b64,
-            output_dir=output_dir,
-            max_rounds=max_rounds,
-            temperature=temperature,
-            max_attempts=max_attempts,
-            retry_base_delay=retry_base_delay,
-        )
-        logger.info(
-            "Vision refinement for pages %s took %.2fs",
+def _needs_vision_refinement(markdown: str) -> bool:
+    """Cheap OCR-defect heuristic deciding whether a page is worth a vision call.
+
+    Flags pages with images or figures (OCR only sees their placeholder),
+    replacement or control characters, and tables whose rows have a
+    different cell count from their header.
+    """
+    if _MARKDOWN_IMAGE_RE.search(markdown):
+        return True
+    if "\ufffd" in markdown or _CONTROL_CHARS_RE.search(markdown):
+        return True
+    header_columns: Optional[int] = None
+    previous = ""
+    for line in markdown.splitlines():
+        stripped = line.strip()
+        if header_columns is None:
+            # A table starts at a delimiter row (|---|---|) under a piped header.
+            if _TABLE_DELIMITER_RE.match(stripped) and _UNESCAPED_PIPE_RE.search(previous):
+                header_columns = _count_table_cells(previous)
+                if _count_table_cells(stripped) != header_columns:
+                    return True
+        elif not _UNESCAPED_PIPE_RE.search(stripped):
+            header_columns = None
+        elif _count_table_cells(stripped) != header_columns:
+            return True
+        previous = stripped
+    return False
+
+
+def _refine_vision_window(
+    pages: Sequence[dict[str, Optional[object]]],
+    images_b64: dict[int, Optional[str]],
+    window: tuple[int, ...],
+    *,
+    image_max_dim: int,
+    **refine_kwargs: object,
+) -> list[str]:
+    """Refine the pages at the (zero-based) indices in window in one request.
+
+    Page images are shrunk on first use and cached in images_b64, since a
+    page can appear in two windows and several rounds.
+    """
+    page_numbers = [index + 1 for index in window]
+    original_markdowns = [
+        _extract_attr(pages[index], "markdown", "") or "" for index in window
+    ]
+    for index in window:
+        if index not in images_b64:
+            images_b64[index] = _shrink_page_image(pages[index], image_max_dim)
+
+    win_t0 = time.perf_counter()
+    updated_markdowns = _refine_page_group_with_vision(
+        page_numbers=page_numbers,
+        original_markdowns=original_markdowns,
+        images_b64=[images_b64[index] for index in window],
+        **refine_kwargs,  # type: ignore[arg-type]
+    )
+    logger.info(
+        "Vision refinement for pages %s took %.2fs",
+        page_numbers,
+        time.perf_counter() - win_t0,
+    )
+    if len(updated_markdowns) != len(window):
+        logger.warning(
+            "Vision refinement returned %d page(s) for window %s; expected %d.",
+            len(updated_markdowns),
             page_numbers,
-            time.perf_counter() - win_t0,
+            len(window),
         )
+    return updated_markdowns
+
+
+class _PairwiseVisionRefiner:
+    """Refine windows of window_size consecutive pages with the vision model as pages arrive.
+
+    Pages must be added in document order. Blank pages (title pages, empty
+    scans) are left as-is and never sent; text pages are grouped into windows
+    of window_size (2 by default: each page with the next), and unless
+    refine_all is set, windows whose pages all pass _needs_vision_refinement
+    are dropped. Larger windows send several pages per request, so a document
+    needs about 1/(window_size - 1) as many vision calls.
+
+    Consecutive windows overlap on one page, so they are refined in two phases
+    of disjoint windows ([1,2], [3,4], ... then [2,3], [4,5], ... for pairs;
+    [1,2,3], [5,6,7], ... then [3,4,5], ... for triples). Phase-one
+    windows are submitted as soon as both pages are known, so they overlap
+    with whatever is still producing pages (e.g. per-page OCR); finish() runs
+    the second phase on top of the first phase's edits, so every page
+    boundary is still reviewed with current text. Dropping windows keeps
+    every other window disjoint, so the phases never share a page.
+    """
 
-        if len(updated_markdowns) != 2:
-            logger.warning(
-                "Vision refinement returned %d page(s) for window %s; expected 2.",
-                len(updated_markdowns),
-                page_numbers,
-            )
+    def __init__(
+        self,
+        executor: ThreadPoolExecutor,
+        *,
+        image_max_dim: int,
+        refine_all: bool,
+        window_size: int = 2,
+        **refine_kwargs: object,
+    ) -> None:
+        if window_size < 2:
+            raise ValueError("window_size must be >= 2 so windows share a boundary page.")
+        self._executor = executor
+        self._image_max_dim = image_max_dim
+        self._refine_all = refine_all
+        self._window_size = window_size
+        self._refine_kwargs = refine_kwargs
+        self.pages: list[dict[str, Optional[object]]] = []
+        self._images_b64: dict[int, Optional[str]] = {}
+        self._needs_review: dict[int, bool] = {}
+        self._open_window: list[int] = []
+        self._windows: list[tuple[int, ...]] = []
+        self._phase_one: dict[Future[list[str]], tuple[int, ...]] = {}
+
+    def add_page(self, page: dict[str, Optional[object]]) -> None:
+        index = len(self.pages)
+        self.pages.append(page)
+        markdown = _extract_attr(page, "markdown", "") or ""
+        if not markdown.strip():
+            return
+        self._needs_review[index] = self._refine_all or _needs_vision_refinement(markdown)
+        self._open_window.append(index)
+        if len(self._open_window) == self._window_size:
+            window = tuple(self._open_window)
+            # The last page also opens the next window, so boundaries overlap.
+            self._open_window = [index]
+            self._add_window(window)
+
+    def finish(self) -> None:
+        # A trailing partial window only exists when window_size > 2.
+        if len(self._open_window) > 1:
+            self._add_window(tuple(self._open_window))
+        self._open_window = []
+        self._apply(self._phase_one)
+        self._apply({self._submit(window): window for window in self._windows[1::2]})
+
+    def _add_window(self, window: tuple[int, ...]) -> None:
+        if not any(self._needs_review[index] for index in window):
+            return
+        if len(self._windows) % 2 == 0:
+            self._phase_one[self._submit(window)] = window
+        self._windows.append(window)
+
+    def _submit(self, window: tuple[int, ...]) -> Future[list[str]]:
+        return self._executor.submit(
+            _refine_vision_window,
+            self.pages,
+            self._images_b64,
+            window,
+            image_max_dim=self._image_max_dim,
+            **self._refine_kwargs,
+        )
 
-        pair = [
-            (page_numbers[0], left_entry),
-            (page_numbers[1], right_entry),
-        ]
-        for (page_number, page_entry), updated_markdown in zip(pair, updated_markdowns):
-            if isinstance(page_entry, dict):
-                page_entry["markdown"] = updated_markdown
-            else:
-                try:
-                    setattr(page_entry, "markdown", updated_markdown)
-                except Exception:
-                    logger.debug(
-                        "Unable to assign updated markdown for page %d (non-dict entry).",
-                        page_number,
-                    )
+    def _apply(self, futures: dict[Future[list[str]], tuple[int, ...]]) -> None:
+        results: dict[tuple[int, ...], list[str]] = {}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+        for window in sorted(results):
+            for index, updated_markdown in zip(window, results[window]):
+                page_entry = self.pages[index]
+                if isinstance(page_entry, dict):
+                    page_entry["markdown"] = updated_markdown
+                else:
+                    try:
+                        setattr(page_entry, "markdown", updated_markdown)
+                    except Exception:
+                        logger.debug(
+                            "Unable to assign updated markdown for page %d (non-dict entry).",
+                            index + 1,
+                        )
+
+
+@contextmanager
+def _vision_refinement(
+    pdf_path: Path,
+    *,
+    document_dir: Path,
+    vision_model: Optional[str],
+    vision_max_rounds: int,
+    vision_temperature: float,
+    vision_max_retries: int,
+    vision_retry_base_delay: float,
+    vision_concurrency: int = 4,
+    vision_image_max_dim: int = 1600,
+    vision_image_detail: str = "auto",
+    vision_refine_all: bool = False,
+    vision_batch_size: int = 2,
+    vision_client: Optional[OpenAI] = None,
+) -> Iterator[Optional[Callable[[dict[str, Optional[object]]], None]]]:
+    """Yield a callback that feeds pages (in order) to pairwise vision refinement.
+
+    Yields None when vision_model is empty. Windows are refined while the
+    caller is still producing pages; the rest complete when the block exits.
+    """
+    if not vision_model:
+        yield None
+        return
+
+    # Created once here; the per-window refinement only writes into it.
+    vision_diff_dir = document_dir / "vision_diffs"
+    vision_diff_dir.mkdir(exist_ok=True)
+    try:
+        if vision_client is None:
+            vision_client = get_vision_client()
+    except Exception as exc:
+        logger.exception("Vision refinement failed for %s: %s", pdf_path.name, exc)
+        raise
+
+    executor = ThreadPoolExecutor(max_workers=max(1, vision_concurrency))
+    try:
+        refiner = _PairwiseVisionRefiner(
+            executor,
+            image_max_dim=vision_image_max_dim,
+            refine_all=vision_refine_all,
+            window_size=vision_batch_size,
+            client=vision_client,
+            model=vision_model,
+            output_dir=vision_diff_dir,
+            max_rounds=vision_max_rounds,
+            temperature=vision_temperature,
+            max_attempts=vision_max_retries,
+            retry_base_delay=vision_retry_base_delay,
+            image_detail=vision_image_detail,
+        )
+        yield refiner.add_page
+        try:
+            refiner.finish()
+        except Exception as exc:
+            logger.exception("Vision refinement failed for %s: %s", pdf_path.name, exc)
+            raise
+    except BaseException:
+        # OCR or a refinement window failed; drop windows that have not started.
+        executor.shutdown(cancel_futures=True)
+        raise
+    finally:
+        executor.shutdown()
 
 
 def _request_mistral_ocr(
@@ -617,63 +904,103 @@ def _request_mistral_ocr(
     ocr_model: str,
     max_attempts: int = 3,
     base_delay: float = 2.0,
+    rate_limiter: Optional[RateLimiter] = None,
 ) -> object:
-    last_error: Optional[Exception] = None
-    for attempt in range(1, max_attempts + 1):
-        try:
+    def _process() -> object:
+        # Only the request itself holds a limiter slot, not the backoff.
+        with rate_limiter if rate_limiter is not None else nullcontext():
             return client.ocr.process(
                 model=ocr_model,
                 document=document_payload,
                 include_image_base64=include_images,
             )
-        except Exception as exc:
-            last_error = exc
-            if attempt >= max_attempts or not _is_retryable_ocr_error(exc):
-                raise
-            wait = base_delay * attempt
-            logger.warning(
-                "Mistral OCR request failed (%s). Retrying in %.1f seconds (%d/%d).",
-                exc.__class__.__name__,
-                wait,
-                attempt,
-                max_attempts,
-            )
-            time.sleep(wait)
-    if last_error:
-        raise last_error
-    raise RuntimeError("Unexpected OCR retry loop termination.")
 
+    return retry_with_backoff(
+        _process,
+        is_retryable=_is_retryable_ocr_error,
+        max_attempts=max_attempts,
+        base_delay=base_delay,
+        description="Mistral OCR request",
+    )
 
-def pdf_to_markdown_pipeline(
-    pdf_path: Path,
-    output_root: Path,
-    *,
-    include_images: bool = True,
-    ocr_model: str = "mistral-ocr-latest",
-    save_response: bool = False,
-    save_page_markdown: bool = True,
-    vision_model: Optional[str] = None,
-    vision_max_rounds: int = 3,
-    vision_temperature: float = 0.0,
-    vision_max_retries: int = 3,
-    vision_retry_base_delay: float = 2.0,
-    max_upload_bytes: int = 10 * 1024 * 1024,
-) -> Path:
-    """Perform OCR with Mistral and persist Markdown (and optional page images)."""
-    pipeline_t0 = time.perf_counter()
-    pdf_path = pdf_path.resolve()
-    if not pdf_path.is_file():
-        raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-    output_root = output_root.resolve()
+def _create_document_dir(
+    pdf_path: Path, output_root: Path, include_images: bool
+) -> tuple[Path, Path]:
+    """Create a fresh `<timestamp>_<stem>` output directory for pdf_path.
+
+    PDFs with the same stem (e.g. from different input folders, or packed into
+    one batch) can start in the same second, so a taken name gets a `-N`
+    suffix on the timestamp instead of being shared.
+    """
+    output_root.mkdir(parents=True, exist_ok=True)
     timestamp_prefix = datetime.now().strftime("%Y%m%d_%H%M%S")
     document_dir = output_root / f"{timestamp_prefix}_{pdf_path.stem}"
-    document_dir.mkdir(parents=True, exist_ok=True)
+    suffix = 1
+    while True:
+        try:
+            document_dir.mkdir()
+            break
+        except FileExistsError:
+            suffix += 1
+            document_dir = output_root / f"{timestamp_prefix}-{suffix}_{pdf_path.stem}"
     images_dir = document_dir / "images"
     if include_images:
         images_dir.mkdir(exist_ok=True)
+    return document_dir, images_dir
+
+
+@contextmanager
+def _remove_on_failure(document_dirs: list[Path]) -> Iterator[None]:
+    """Delete the output directories in document_dirs if the block raises.
+
+    Every attempt gets a fresh timestamped directory, so a failed attempt
+    would otherwise leave a partial one behind for each retry.
+    """
+    try:
+        yield
+    except BaseException:
+        for document_dir in document_dirs:
+            shutil.rmtree(document_dir, ignore_errors=True)
+        raise
 
-    mistral_client = create_mistral_client()
+
+def _merge_pdfs(pdf_paths: Sequence[Path]) -> tuple[bytes, list[int]]:
+    """Concatenate PDFs in memory and return (merged_bytes, page_count_per_pdf)."""
+    try:
+        from pypdf import PdfReader, PdfWriter  # type: ignore[import]
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "Batching PDFs requires the 'pypdf' package. Install it with `pip install pypdf`."
+        ) from exc
+
+    writer = PdfWriter()
+    page_counts: list[int] = []
+    for pdf_path in pdf_paths:
+        reader = PdfReader(str(pdf_path))
+        page_counts.append(len(reader.pages))
+        writer.append(reader)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue(), page_counts
+
+
+def _ocr_document(
+    pdf_path: Path,
+    *,
+    client: Mistral,
+    include_images: bool,
+    ocr_model: str,
+    max_upload_bytes: int,
+    ocr_concurrency: int = 16,
+    rate_limiter: Optional[RateLimiter] = None,
+    on_page: Optional[Callable[[dict[str, Optional[object]]], None]] = None,
+) -> tuple[list[dict[str, Optional[object]]], object]:
+    """OCR a PDF (whole or split per page) and return (normalised_pages, persistence_payload).
+
+    on_page, if given, is called with each normalised page in document order
+    as soon as it is available.
+    """
     pdf_size_bytes = pdf_path.stat().st_size
     requires_split = _should_split_document(pdf_path, max_upload_bytes)
     aggregated_pages: list[dict[str, Optional[object]]] = []
@@ -687,10 +1014,11 @@ def pdf_to_markdown_pipeline(
         }
         t_doc_ocr0 = time.perf_counter()
         response = _request_mistral_ocr(
-            mistral_client,
+            client,
             document_payload=document_payload,
             include_images=include_images,
             ocr_model=ocr_model,
+            rate_limiter=rate_limiter,
         )
         logger.info(
             "OCR (full document) for %s took %.2fs",
@@ -701,6 +1029,9 @@ def pdf_to_markdown_pipeline(
         if isinstance(response, dict):
             pages = response.get("pages", [])
         aggregated_pages.extend(_normalise_page_entry(page) for page in pages)
+        if on_page is not None:
+            for page_entry in aggregated_pages:
+                on_page(page_entry)
         persistence_payload = response
     else:
         logger.info(
@@ -710,94 +1041,126 @@ def pdf_to_markdown_pipeline(
             max_upload_bytes,
         )
         chunk_metadata: list[dict[str, object]] = []
-        with _prepare_pdf_page_chunks(pdf_path) as page_chunks:
-            split_phase_t0 = time.perf_counter()
-            with ThreadPoolExecutor(max_workers=3) as executor:
-                futures = {
-                    executor.submit(
-                        _process_pdf_chunk,
-                        local_page_index=local_page_index,
-                        chunk_path=chunk_path,
-                        client=mistral_client,
-                        include_images=include_images,
-                        ocr_model=ocr_model,
-                    ): (local_page_index, chunk_path)
-                    for local_page_index, chunk_path in page_chunks
-                }
-
-                # Collect results keyed by original page order to avoid reordering
-                per_page_results: dict[int, list[dict[str, Optional[object]]]] = {}
-                per_page_metadata: list[dict[str, object]] = []
+        failed_pages: list[tuple[int, Exception]] = []
+        split_phase_t0 = time.perf_counter()
 
-                for future in as_completed(futures):
-                    local_page_index, chunk_path = futures[future]
-                    try:
-                        _, chunk_response, normalised_pages = future.result()
-                    except Exception as exc:
-                        logger.exception(
-                            "Error processing chunk %s (page %d) for %s: %s",
-                            chunk_path.name,
-                            local_page_index + 1,
-                            pdf_path.name,
-                            exc,
-                        )
+        def _process_page(
+            payload: tuple[int, str],
+        ) -> Optional[list[dict[str, Optional[object]]]]:
+            local_page_index, document_url = payload
+            try:
+                _, _, normalised_pages = _process_pdf_chunk(
+                    local_page_index=local_page_index,
+                    document_url=document_url,
+                    client=client,
+                    include_images=include_images,
+                    ocr_model=ocr_model,
+                    rate_limiter=rate_limiter,
+                )
+            except Exception as exc:
+                logger.exception(
+                    "Error processing chunk for page %d of %s: %s",
+                    local_page_index + 1,
+                    pdf_path.name,
+                    exc,
+                )
+                failed_pages.append((local_page_index + 1, exc))
+                return None
+            return normalised_pages
+
+        # Each page is one network-bound request, so the pool scales with the
+        # page count up to ocr_concurrency. _map_bounded yields in page order
+        # and only builds as many page payloads as there are workers.
+        processed_pages = 0
+        with _open_pdf_source(pdf_path) as source:
+            max_workers = min(max(1, len(source.pages)), max(1, ocr_concurrency))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for local_page_index, normalised_pages in enumerate(
+                    _map_bounded(
+                        executor,
+                        _process_page,
+                        _iter_pdf_page_payloads(source),
+                        max_workers,
+                    )
+                ):
+                    if normalised_pages is None:
                         continue
-
                     if not normalised_pages:
                         logger.warning(
                             "Empty OCR result returned for %s page %d while splitting.",
                             pdf_path.name,
                             local_page_index + 1,
                         )
-                    per_page_results[local_page_index] = normalised_pages
-                    per_page_metadata.append(
+                    processed_pages += 1
+                    # Chunks only reference their slice of "pages" so the
+                    # base64 images are persisted once.
+                    chunk_metadata.append(
                         {
                             "page_number": local_page_index + 1,
-                            "pages": normalised_pages,
+                            "page_offset": len(aggregated_pages),
+                            "page_count": len(normalised_pages),
                         }
                     )
-
-                # Assemble pages in correct order
-                for local_page_index in sorted(per_page_results.keys()):
-                    aggregated_pages.extend(per_page_results[local_page_index])
-
-                # Keep metadata in sorted page_number order as well
-                chunk_metadata = sorted(
-                    per_page_metadata, key=lambda m: int(m.get("page_number", 0))
-                )
-            logger.info(
-                "OCR split phase for %s took %.2fs across %d page(s)",
-                pdf_path.name,
-                time.perf_counter() - split_phase_t0,
-                len(per_page_results),
-            )
+                    aggregated_pages.extend(normalised_pages)
+                    if on_page is not None:
+                        for page_entry in normalised_pages:
+                            on_page(page_entry)
+        logger.info(
+            "OCR split phase for %s took %.2fs across %d page(s)",
+            pdf_path.name,
+            time.perf_counter() - split_phase_t0,
+            processed_pages,
+        )
+        if failed_pages:
+            # A document with dropped pages must not be written (and
+            # fingerprinted) as complete; chaining the first error keeps rate
+            # limits retryable by the caller.
+            failed_pages.sort(key=lambda failure: failure[0])
+            raise RuntimeError(
+                f"OCR failed for {len(failed_pages)} page(s) of {pdf_path.name}: "
+                f"{', '.join(str(page_number) for page_number, _ in failed_pages)}"
+            ) from failed_pages[0][1]
         persistence_payload = {
             "mode": "split_per_page",
             "chunks": chunk_metadata,
             "pages": aggregated_pages,
         }
 
-    pages = aggregated_pages
-    markdown_chunks: list[str] = []
-    vision_diff_dir = document_dir / "vision_diffs"
+    return aggregated_pages, persistence_payload
 
-    if vision_model:
-        try:
-            vision_client = create_vision_client()
-            _apply_pairwise_vision_refinement(
-                pages,
-                client=vision_client,
-                model=vision_model,
-                output_dir=vision_diff_dir,
-                max_rounds=vision_max_rounds,
-                temperature=vision_temperature,
-                max_attempts=vision_max_retries,
-                retry_base_delay=vision_retry_base_delay,
-            )
-        except Exception as exc:
-            logger.exception("Vision refinement failed for %s: %s", pdf_path.name, exc)
-            raise
 
+def _write_page_file(task: tuple[Path, bytes | str]) -> None:
+    """Write a page artefact: raw bytes as-is, a str is a base64 image to decode."""
+    path, payload = task
+    if isinstance(payload, str):
+        payload = base64.b64decode(payload)
+    path.write_bytes(payload)
+
+
+def _release_page_images(pages: Sequence[dict[str, Optional[object]]]) -> None:
+    """Drop base64 page images once they are on disk so they can be freed."""
+    for page in pages:
+        if isinstance(page, dict):
+            page["image_base64"] = None
+
+
+def _write_document_outputs(
+    pdf_path: Path,
+    pages: list[dict[str, Optional[object]]],
+    persistence_payload: object,
+    *,
+    document_dir: Path,
+    images_dir: Path,
+    include_images: bool,
+    save_response: bool,
+    save_page_markdown: bool,
+) -> Path:
+    """Persist Markdown, images and the OCR response for already-refined pages."""
+    markdown_chunks: list[str] = []
+
+    # Per-page files are independent, so collect them and write (and decode
+    # images) on a thread pool instead of one syscall after another.
+    page_writes: list[tuple[Path, bytes | str]] = []
     for idx, page in enumerate(pages):
         page_markdown = _extract_attr(page, "markdown", "") or ""
         if not page_markdown.strip():
@@ -813,9 +1176,9 @@ def pdf_to_markdown_pipeline(
         markdown_chunks.append(page_markdown)
 
         if save_page_markdown:
-            page_markdown_path = document_dir / f"page-{page_index:04d}.md"
-            page_markdown_path.write_text(page_markdown, encoding="utf-8")
-            logger.debug("Wrote per-page markdown: %s", page_markdown_path.name)
+            page_writes.append(
+                (document_dir / f"page-{page_index:04d}.md", page_markdown.encode("utf-8"))
+            )
 
         if not include_images:
             continue
@@ -828,9 +1191,19 @@ def pdf_to_markdown_pipeline(
             file_index = raw_page_index + 1
         else:
             file_index = page_index
-        image_bytes = base64.b64decode(image_b64)
-        image_path = images_dir / f"page-{file_index:04d}.jpeg"
-        image_path.write_bytes(image_bytes)
+        # Kept base64 so the decode also runs on the pool.
+        page_writes.append((images_dir / f"page-{file_index:04d}.jpeg", image_b64))
+
+    if page_writes:
+        with ThreadPoolExecutor(max_workers=min(16, len(page_writes))) as executor:
+            # list() re-raises the first write error, if any.
+            list(executor.map(_write_page_file, page_writes))
+        logger.debug("Wrote %d per-page file(s) for %s", len(page_writes), pdf_path.name)
+        page_writes.clear()
+    # The split-mode response shares these page dicts, so keep the images
+    # until it has been saved.
+    if not save_response:
+        _release_page_images(pages)
 
     # Join pages into a single markdown file with a single newline between pages.
     final_markdown = "\n".join(
@@ -840,20 +1213,226 @@ def pdf_to_markdown_pipeline(
     final_markdown = normalize_toc_markdown(final_markdown) if final_markdown else ""
 
     markdown_path = document_dir / "combined_markdown.md"
-    markdown_path.write_text(final_markdown, encoding="utf-8")
+    markdown_path.write_bytes(final_markdown.encode("utf-8"))
     logger.info("Wrote Markdown to %s", markdown_path)
 
     if save_response:
         _persist_response(persistence_payload, document_dir)
+        _release_page_images(pages)
+
+    return markdown_path
+
+
+def pdf_to_markdown_pipeline(
+    pdf_path: Path,
+    output_root: Path,
+    *,
+    include_images: bool = True,
+    ocr_model: str = "mistral-ocr-latest",
+    save_response: bool = False,
+    save_page_markdown: bool = True,
+    vision_model: Optional[str] = None,
+    vision_max_rounds: int = 3,
+    vision_temperature: float = 0.0,
+    vision_max_retries: int = 3,
+    vision_retry_base_delay: float = 2.0,
+    vision_concurrency: int = 4,
+    vision_image_max_dim: int = 1600,
+    vision_image_detail: str = "auto",
+    vision_refine_all: bool = False,
+    vision_batch_size: int = 2,
+    max_upload_bytes: int = 10 * 1024 * 1024,
+    ocr_concurrency: int = 16,
+    client: Optional[Mistral] = None,
+    vision_client: Optional[OpenAI] = None,
+    ocr_rate_limiter: Optional[RateLimiter] = None,
+) -> Path:
+    """Perform OCR with Mistral and persist Markdown (and optional page images).
+
+    Pass client / vision_client to reuse one SDK client (and its keep-alive
+    connection pool) across documents; otherwise process-wide cached clients are used.
+    Share one ocr_rate_limiter across calls to cap and pace every OCR request,
+    including the per-page requests of split PDFs.
+    """
+    pipeline_t0 = time.perf_counter()
+    pdf_path = pdf_path.resolve()
+    if not pdf_path.is_file():
+        raise FileNotFoundError(f"PDF not found: {pdf_path}")
+
+    output_root = output_root.resolve()
+    document_dir, images_dir = _create_document_dir(pdf_path, output_root, include_images)
+
+    with _remove_on_failure([document_dir]):
+        # Pages are handed to vision refinement as their OCR completes, so the
+        # two network-bound stages overlap on split PDFs.
+        with _vision_refinement(
+            pdf_path,
+            document_dir=document_dir,
+            vision_model=vision_model,
+            vision_max_rounds=vision_max_rounds,
+            vision_temperature=vision_temperature,
+            vision_max_retries=vision_max_retries,
+            vision_retry_base_delay=vision_retry_base_delay,
+            vision_concurrency=vision_concurrency,
+            vision_image_max_dim=vision_image_max_dim,
+            vision_image_detail=vision_image_detail,
+            vision_refine_all=vision_refine_all,
+            vision_batch_size=vision_batch_size,
+            vision_client=vision_client,
+        ) as on_page:
+            pages, persistence_payload = _ocr_document(
+                pdf_path,
+                client=client if client is not None else get_mistral_client(),
+                include_images=include_images,
+                ocr_model=ocr_model,
+                max_upload_bytes=max_upload_bytes,
+                ocr_concurrency=ocr_concurrency,
+                rate_limiter=ocr_rate_limiter,
+                on_page=on_page,
+            )
+        markdown_path = _write_document_outputs(
+            pdf_path,
+            pages,
+            persistence_payload,
+            document_dir=document_dir,
+            images_dir=images_dir,
+            include_images=include_images,
+            save_response=save_response,
+            save_page_markdown=save_page_markdown,
+        )
 
     # Final summary timing
-    total_elapsed = time.perf_counter() - pipeline_t0
-    total_pages = len(pages)
     logger.info(
         "Completed %s with %d page(s) in %.2fs",
         pdf_path.name,
-        total_pages,
-        total_elapsed,
+        len(pages),
+        time.perf_counter() - pipeline_t0,
     )
 
     return markdown_path
+
+
+def pdf_batch_to_markdown_pipeline(
+    pdf_paths: Sequence[Path],
+    output_root: Path,
+    *,
+    include_images: bool = True,
+    ocr_model: str = "mistral-ocr-latest",
+    save_response: bool = False,
+    save_page_markdown: bool = True,
+    vision_model: Optional[str] = None,
+    vision_max_rounds: int = 3,
+    vision_temperature: float = 0.0,
+    vision_max_retries: int = 3,
+    vision_retry_base_delay: float = 2.0,
+    vision_concurrency: int = 4,
+    vision_image_max_dim: int = 1600,
+    vision_image_detail: str = "auto",
+    vision_refine_all: bool = False,
+    vision_batch_size: int = 2,
+    client: Optional[Mistral] = None,
+    vision_client: Optional[OpenAI] = None,
+    ocr_rate_limiter: Optional[RateLimiter] = None,
+) -> list[Path]:
+    """OCR several small PDFs in one merged Mistral request and write per-PDF outputs.
+
+    The PDFs are concatenated in memory, sent as a single document, and the
+    returned pages are split back per PDF using the page counts recorded while
+    merging. Each PDF gets its own output directory, exactly as with
+    pdf_to_markdown_pipeline. Returns the combined Markdown paths in input order.
+    """
+    pipeline_t0 = time.perf_counter()
+    pdf_paths = [pdf_path.resolve() for pdf_path in pdf_paths]
+    for pdf_path in pdf_paths:
+        if not pdf_path.is_file():
+            raise FileNotFoundError(f"PDF not found: {pdf_path}")
+    output_root = output_root.resolve()
+
+    merged_bytes, page_counts = _merge_pdfs(pdf_paths)
+    document_payload = {
+        "type": "document_url",
+        "document_url": _encode_pdf_bytes(merged_bytes),
+    }
+    t_ocr0 = time.perf_counter()
+    response = _request_mistral_ocr(
+        client if client is not None else get_mistral_client(),
+        document_payload=document_payload,
+        include_images=include_images,
+        ocr_model=ocr_model,
+        rate_limiter=ocr_rate_limiter,
+    )
+    logger.info(
+        "OCR (batch of %d PDFs, %d bytes) took %.2fs",
+        len(pdf_paths),
+        len(merged_bytes),
+        time.perf_counter() - t_ocr0,
+    )
+    raw_pages: Sequence[object] = _extract_attr(response, "pages", [])  # type: ignore[arg-type]
+    if isinstance(response, dict):
+        raw_pages = response.get("pages", [])
+    merged_pages = [_normalise_page_entry(page) for page in raw_pages]
+    if len(merged_pages) != sum(page_counts):
+        raise RuntimeError(
+            f"Batched OCR returned {len(merged_pages)} page(s); expected {sum(page_counts)}."
+        )
+
+    batch_names = [pdf_path.name for pdf_path in pdf_paths]
+    markdown_paths: list[Path] = []
+    document_dirs: list[Path] = []
+    page_offset = 0
+    with _remove_on_failure(document_dirs):
+        for pdf_path, page_count in zip(pdf_paths, page_counts):
+            pages = merged_pages[page_offset : page_offset + page_count]
+            # Re-base page indices so image files are numbered per PDF.
+            for local_index, page in enumerate(pages):
+                page["index"] = local_index
+            persistence_payload = {
+                "mode": "batched",
+                "batch": batch_names,
+                "page_offset": page_offset,
+                "pages": pages,
+            }
+            page_offset += page_count
+
+            document_dir, images_dir = _create_document_dir(
+                pdf_path, output_root, include_images
+            )
+            document_dirs.append(document_dir)
+            with _vision_refinement(
+                pdf_path,
+                document_dir=document_dir,
+                vision_model=vision_model,
+                vision_max_rounds=vision_max_rounds,
+                vision_temperature=vision_temperature,
+                vision_max_retries=vision_max_retries,
+                vision_retry_base_delay=vision_retry_base_delay,
+                vision_concurrency=vision_concurrency,
+                vision_image_max_dim=vision_image_max_dim,
+                vision_image_detail=vision_image_detail,
+                vision_refine_all=vision_refine_all,
+                vision_batch_size=vision_batch_size,
+                vision_client=vision_client,
+            ) as on_page:
+                if on_page is not None:
+                    for page in pages:
+                        on_page(page)
+            markdown_paths.append(
+                _write_document_outputs(
+                    pdf_path,
+                    pages,
+                    persistence_payload,
+                    document_dir=document_dir,
+                    images_dir=images_dir,
+                    include_images=include_images,
+                    save_response=save_response,
+                    save_page_markdown=save_page_markdown,
+                )
+            )
+
+    logger.info(
+        "Completed batch of %d PDF(s) with %d page(s) in %.2fs",
+        len(pdf_paths),
+        len(merged_pages),
+        time.perf_counter() - pipeline_t0,
+    )
+    return markdown_paths
@@ -0,0 +1,55 @@
+"""Request pacing for Mistral OCR calls shared across PDF and page threads."""
+
+import threading
+import time
+from types import TracebackType
+from typing import Optional
+
+
+class RateLimiter:
+    """Cap in-flight requests and space request starts at least 1/rps apart.
+
+    Thread-safe; use as a context manager around each request. max_concurrency
+    <= 0 and rps <= 0 disable the respective limit.
+    """
+
+    def __init__(self, rps: float = 0.0, max_concurrency: int = 0) -> None:
+        self._interval = 1.0 / rps if rps > 0 else 0.0
+        self._semaphore = (
+            threading.BoundedSemaphore(max_concurrency) if max_concurrency > 0 else None
+        )
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def acquire(self) -> None:
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        if not self._interval:
+            return
+        # Reserve the next start slot under the lock, then sleep outside it so
+        # other threads can queue up behind this one.
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+    def release(self) -> None:
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.release()
+
+
+__all__ = ["RateLimiter"]
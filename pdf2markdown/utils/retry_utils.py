@@ -0,0 +1,83 @@
+"""Retry helpers shared by the PDF2Markdown CLI and pipeline."""
+
+import logging
+import random
+import time
+from typing import Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Return True if exc (or an exception it was raised from) is a rate-limit/quota error."""
+    current: BaseException | None = exc
+    while current is not None:
+        if getattr(current, "status_code", None) == 429:
+            return True
+        message = str(current).lower()
+        if "rate limit" in message or "quota" in message:
+            return True
+        current = current.__cause__
+    return False
+
+
+def is_transient_http_error(exc: BaseException) -> bool:
+    """Return True for throttling (429/quota) or a transient 5xx gateway/server error."""
+    return (
+        getattr(exc, "status_code", None) in TRANSIENT_STATUS_CODES
+        or is_rate_limit_error(exc)
+    )
+
+
+def backoff_delay(
+    attempt: int, base_delay: float, max_delay: float, jitter: float
+) -> float:
+    """Exponential backoff for a zero-based attempt, capped and with proportional jitter."""
+    delay = min(max_delay, base_delay * (2**attempt))
+    return delay * (1 + random.uniform(0, jitter))
+
+
+def retry_with_backoff(
+    fn: Callable[[], T],
+    *,
+    is_retryable: Callable[[Exception], bool],
+    max_attempts: int = 3,
+    base_delay: float = 2.0,
+    max_delay: float = 60.0,
+    jitter: float = 0.25,
+    description: str = "Request",
+) -> T:
+    """Call fn, retrying retryable errors with exponential backoff.
+
+    The last error (or the first non-retryable one) is re-raised.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return fn()
+        except Exception as exc:
+            if attempt >= max_attempts - 1 or not is_retryable(exc):
+                raise
+            wait = backoff_delay(attempt, max(base_delay, 0.0), max_delay, jitter)
+            logger.warning(
+                "%s failed (%s). Retrying in %.1f seconds (%d/%d).",
+                description,
+                exc.__class__.__name__,
+                wait,
+                attempt + 1,
+                max_attempts,
+            )
+            time.sleep(wait)
+    raise RuntimeError(f"{description}: max_attempts must be >= 1.")
+
+
+__all__ = [
+    "TRANSIENT_STATUS_CODES",
+    "backoff_delay",
+    "is_rate_limit_error",
+    "is_transient_http_error",
+    "retry_with_backoff",
+]
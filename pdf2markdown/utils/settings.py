@@ -0,0 +1,121 @@
+"""Environment and llm_config.yml settings for the PDF2Markdown CLI.
+
+Values are parsed and validated once per process so a malformed variable
+fails the run at startup instead of part-way through a batch.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+from utils import load_llm_config
+
+
+@dataclass(frozen=True)
+class PdfToMarkdownSettings:
+    ocr_model: str
+    vision_model: str
+    max_upload_bytes: int
+    pdf_concurrency: int
+    pdf_concurrency_large: int
+    ocr_rps: float
+    ocr_max_concurrency: int
+    ocr_concurrency: int
+    pdf_max_retries: int
+    pdf_retry_base_delay: float
+    pdf_retry_max_delay: float
+    pdf_retry_jitter: float
+
+
+@dataclass(frozen=True)
+class VisionSettings:
+    temperature: float
+    max_rounds: int
+    max_retries: int
+    retry_base_delay: float
+    concurrency: int
+    image_max_dim: int
+    image_detail: str
+    batch_size: int
+
+
+def _int_env(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise ValueError(f"{name} must be an integer, got {raw!r}.") from exc
+
+
+def _float_env(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return float(raw)
+    except ValueError as exc:
+        raise ValueError(f"{name} must be a number, got {raw!r}.") from exc
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> PdfToMarkdownSettings:
+    """Build settings from env vars (call after load_dotenv) with llm_config.yml fallbacks.
+
+    Vision tuning values are parsed separately by get_vision_settings, so an
+    OCR-only run never fails on them.
+
+    Raises:
+        ValueError: If a numeric env var cannot be parsed.
+    """
+    llm_cfg = load_llm_config().get("pdf2markdown", {})
+    return PdfToMarkdownSettings(
+        ocr_model=(os.environ.get("OCR_MODEL") or llm_cfg.get("ocr_model", "")).strip(),
+        vision_model=(os.environ.get("VISION_MODEL") or llm_cfg.get("model", "")).strip(),
+        max_upload_bytes=_int_env("MAX_UPLOAD_BYTES", 10 * 1024 * 1024),
+        pdf_concurrency=_int_env("PDF_CONCURRENCY", 4),
+        pdf_concurrency_large=_int_env("PDF_CONCURRENCY_LARGE", 2),
+        ocr_rps=_float_env("OCR_RPS", 0.0),
+        ocr_max_concurrency=_int_env("OCR_MAX_CONCURRENCY", 0),
+        ocr_concurrency=_int_env("OCR_CONCURRENCY", 16),
+        pdf_max_retries=_int_env("PDF_MAX_RETRIES", 3),
+        pdf_retry_base_delay=_float_env("PDF_RETRY_BASE_DELAY", 1.0),
+        pdf_retry_max_delay=_float_env("PDF_RETRY_MAX_DELAY", 30.0),
+        pdf_retry_jitter=_float_env("PDF_RETRY_JITTER", 0.5),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_vision_settings() -> VisionSettings:
+    """Build vision refinement settings; only call when a vision model is enabled.
+
+    Raises:
+        ValueError: If a vision env var or config value cannot be parsed.
+    """
+    llm_cfg = load_llm_config().get("pdf2markdown", {})
+    try:
+        config_temperature = float(llm_cfg.get("temperature", 0.0))
+    except (TypeError, ValueError) as exc:
+        raise ValueError(
+            f"pdf2markdown.temperature in llm_config.yml must be a number, "
+            f"got {llm_cfg.get('temperature')!r}."
+        ) from exc
+    return VisionSettings(
+        temperature=_float_env("VISION_TEMPERATURE", config_temperature),
+        max_rounds=_int_env("VISION_MAX_ROUNDS", 3),
+        max_retries=_int_env("VISION_MAX_RETRIES", 3),
+        retry_base_delay=_float_env("VISION_RETRY_BASE_DELAY", 2.0),
+        concurrency=_int_env("VISION_CONCURRENCY", 4),
+        image_max_dim=_int_env("VISION_IMAGE_MAX_DIM", 1600),
+        image_detail=(os.environ.get("VISION_IMAGE_DETAIL") or "auto").strip(),
+        batch_size=_int_env("VISION_BATCH_SIZE", 2),
+    )
+
+
+__all__ = [
+    "PdfToMarkdownSettings",
+    "VisionSettings",
+    "get_settings",
+    "get_vision_settings",
+]
@@ -0,0 +1,51 @@
+"""Unit tests for db insert date/datetime coercion."""
+
+from datetime import date, datetime
+
+import pytest
+
+from app.modules.db_insert.utils.normalization import coerce_date, coerce_datetime
+
+
+class TestCoerceDate:
+    """Test coerce_date fast path and fallbacks."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("2020-01-05", date(2020, 1, 5)),
+            ("2020-01-05T10:11:12Z", date(2020, 1, 5)),
+            ("2020/01/05", date(2020, 1, 5)),
+            ("2020", date(2020, 1, 1)),
+        ],
+    )
+    def test_parses_supported_formats(self, text, expected):
+        """Test that ISO, slash-separated and year-only strings are parsed."""
+        assert coerce_date(text) == expected
+
+    @pytest.mark.parametrize("text", ["2020-13-01", "2020-+1-05", "2020-01-05 10:11"])
+    def test_invalid_strings_are_returned_unchanged(self, text):
+        """Test that unparseable strings are passed through for validation."""
+        assert coerce_date(text) == text
+
+
+class TestCoerceDatetime:
+    """Test coerce_datetime fast path and fallbacks."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("2020-01-05", datetime(2020, 1, 5)),
+            ("2020-01-05T10:11:12", datetime(2020, 1, 5, 10, 11, 12)),
+            ("2020-01-05T10:11:12Z", datetime(2020, 1, 5, 10, 11, 12)),
+            ("2020-01-05T10:11:12+02:00", datetime(2020, 1, 5, 8, 11, 12)),
+            ("2020-01-05T10:11:12.5Z", datetime(2020, 1, 5, 10, 11, 12, 500000)),
+        ],
+    )
+    def test_parses_supported_formats(self, text, expected):
+        """Test that ISO strings are parsed to naive UTC datetimes."""
+        assert coerce_datetime(text) == expected
+
+    def test_invalid_time_falls_back_to_date(self):
+        """Test that an invalid time component still yields the date."""
+        assert coerce_datetime("2020-01-05T25:00:00") == datetime(2020, 1, 5)
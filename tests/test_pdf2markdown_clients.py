@@ -0,0 +1,40 @@
+"""Unit tests for PDF2Markdown API client construction."""
+
+import pytest
+
+from pdf2markdown.utils import clients
+
+
+class TestGetVisionClient:
+    """Test the cached OpenRouter vision client."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_client_cache(self):
+        clients._cached_vision_client.cache_clear()
+        yield
+        clients._cached_vision_client.cache_clear()
+
+    def test_reuses_one_client(self, monkeypatch):
+        """Test that repeated calls return the same client instance."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "key-a")
+        monkeypatch.delenv("OPENROUTER_BASE_URL", raising=False)
+
+        assert clients.get_vision_client() is clients.get_vision_client()
+
+    def test_rebuilds_when_env_changes(self, monkeypatch):
+        """Test that a changed base URL builds a new client."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "key-a")
+        first = clients.get_vision_client()
+
+        monkeypatch.setenv("OPENROUTER_BASE_URL", "https://example.invalid/v1")
+        second = clients.get_vision_client()
+
+        assert second is not first
+        assert str(second.base_url).startswith("https://example.invalid/v1")
+
+    def test_requires_api_key(self, monkeypatch):
+        """Test that a missing API key raises RuntimeError."""
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+
+        with pytest.raises(RuntimeError, match="OPENROUTER_API_KEY"):
+            clients.get_vision_client()
@@ -0,0 +1,70 @@
+"""Unit tests for PDF2Markdown conversion fingerprints."""
+
+from pdf2markdown.utils.fingerprint import (
+    compute_fingerprint,
+    find_matching_output,
+    write_fingerprint,
+)
+
+
+class TestComputeFingerprint:
+    """Test fingerprint computation."""
+
+    def test_depends_on_content_and_models(self, tmp_path):
+        """Test that the fingerprint changes with the PDF bytes and the models."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4 a")
+        base = compute_fingerprint(pdf, "ocr", "vision")
+
+        assert compute_fingerprint(pdf, "ocr", "vision") == base
+        assert compute_fingerprint(pdf, "ocr", "") != base
+        pdf.write_bytes(b"%PDF-1.4 b")
+        assert compute_fingerprint(pdf, "ocr", "vision") != base
+
+
+class TestFindMatchingOutput:
+    """Test lookup of a previous conversion's output directory."""
+
+    def test_matches_only_the_same_stem_and_fingerprint(self, tmp_path):
+        """Test that a directory for another stem or fingerprint is ignored."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        output_root = tmp_path / "out"
+        document_dir = output_root / "20260101_120000_doc"
+        document_dir.mkdir(parents=True)
+        (document_dir / "combined_markdown.md").write_text("# doc", encoding="utf-8")
+        other_dir = output_root / "20260101_120000_my_doc"
+        other_dir.mkdir()
+        (other_dir / "combined_markdown.md").write_text("# other", encoding="utf-8")
+        write_fingerprint(other_dir, "abc")
+
+        assert find_matching_output(output_root, pdf, "abc") is None
+        write_fingerprint(document_dir, "abc")
+        assert find_matching_output(output_root, pdf, "abc") == document_dir
+        assert find_matching_output(output_root, pdf, "def") is None
+
+    def test_matches_suffixed_directories(self, tmp_path):
+        """Test that a `-N` suffixed directory still matches its PDF's stem."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        document_dir = tmp_path / "out" / "20260101_120000-2_doc"
+        document_dir.mkdir(parents=True)
+        (document_dir / "combined_markdown.md").write_text("# doc", encoding="utf-8")
+        write_fingerprint(document_dir, "abc")
+
+        assert find_matching_output(tmp_path / "out", pdf, "abc") == document_dir
+
+    def test_escapes_glob_characters_in_the_stem(self, tmp_path):
+        """Test that brackets in a stem match literally rather than as a pattern."""
+        pdf = tmp_path / "report[1].pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        output_root = tmp_path / "out"
+        for stem in ("report[1]", "report1"):
+            document_dir = output_root / f"20260101_120000_{stem}"
+            document_dir.mkdir(parents=True)
+            (document_dir / "combined_markdown.md").write_text("# doc", encoding="utf-8")
+            write_fingerprint(document_dir, "abc")
+
+        assert find_matching_output(output_root, pdf, "abc") == (
+            output_root / "20260101_120000_report[1]"
+        )
@@ -0,0 +1,43 @@
+"""Unit tests for PDF2Markdown input discovery."""
+
+from pdf2markdown.pdf_to_markdown import _iter_pdfs, _resolve_inputs
+
+
+class TestIterPdfs:
+    """Test directory traversal for PDFs."""
+
+    def test_is_lazy_recursive_and_ordered(self, tmp_path):
+        """Test that PDFs are yielded lazily, recursively and in sorted order."""
+        (tmp_path / "b.pdf").write_bytes(b"")
+        (tmp_path / "a.pdf").write_bytes(b"")
+        (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "c.pdf").write_bytes(b"")
+
+        pdfs = _iter_pdfs(tmp_path, "*.pdf")
+
+        assert next(pdfs) == tmp_path / "a.pdf"
+        assert list(pdfs) == [tmp_path / "b.pdf", tmp_path / "sub" / "c.pdf"]
+
+
+class TestResolveInputs:
+    """Test resolution of CLI input paths to PDFs."""
+
+    def test_single_file(self, tmp_path):
+        """Test that a file input is returned as is."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"")
+
+        assert list(_resolve_inputs([pdf], "*.pdf")) == [pdf]
+
+    def test_prunes_excluded_directories(self, tmp_path):
+        """Test that PDFs under an excluded directory are skipped."""
+        (tmp_path / "a.pdf").write_bytes(b"")
+        (tmp_path / "output" / "run").mkdir(parents=True)
+        (tmp_path / "output" / "run" / "generated.pdf").write_bytes(b"")
+
+        pdfs = list(
+            _resolve_inputs([tmp_path], "*.pdf", exclude_dirs=[tmp_path / "output"])
+        )
+
+        assert pdfs == [tmp_path / "a.pdf"]
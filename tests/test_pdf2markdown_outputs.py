@@ -0,0 +1,147 @@
+"""Unit tests for PDF2Markdown output directory handling."""
+
+import sys
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from pdf2markdown.utils.pdf_to_markdown_pipeline import (
+    pdf_batch_to_markdown_pipeline,
+    pdf_to_markdown_pipeline,
+)
+
+# pdf2markdown.utils re-exports the pdf_to_markdown_pipeline function under the
+# module's own name, so the module is looked up directly for monkeypatching.
+pipeline_module = sys.modules[pdf_to_markdown_pipeline.__module__]
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 1, 1, 12, 0, 0)
+
+
+def _write_blank_pdf(path, pages=1):
+    pypdf = pytest.importorskip("pypdf")
+    writer = pypdf.PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=72, height=72)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        writer.write(handle)
+    return path
+
+
+def _ocr_client(process):
+    return SimpleNamespace(ocr=SimpleNamespace(process=process))
+
+
+class TestOutputDirectory:
+    """Test the per-document output directory lifecycle."""
+
+    def test_failed_conversion_leaves_no_output_directory(self, tmp_path):
+        """Test that a failed conversion removes its partial output directory."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        output_root = tmp_path / "out"
+
+        def process(**kwargs):
+            raise RuntimeError("OCR down")
+
+        with pytest.raises(RuntimeError, match="OCR down"):
+            pdf_to_markdown_pipeline(
+                pdf, output_root, client=_ocr_client(process), max_upload_bytes=0
+            )
+
+        assert list(output_root.iterdir()) == []
+
+    def test_successful_conversion_keeps_its_output_directory(self, tmp_path):
+        """Test that a successful conversion keeps exactly one output directory."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        output_root = tmp_path / "out"
+
+        def process(**kwargs):
+            return {"pages": [{"markdown": "# Title", "index": 0}]}
+
+        markdown_path = pdf_to_markdown_pipeline(
+            pdf, output_root, client=_ocr_client(process), max_upload_bytes=0
+        )
+
+        assert markdown_path.read_text(encoding="utf-8").startswith("# Title")
+        assert list(output_root.iterdir()) == [markdown_path.parent]
+
+    def test_same_stem_conversions_get_separate_directories(self, monkeypatch, tmp_path):
+        """Test that PDFs sharing a stem in the same second get separate directories."""
+        monkeypatch.setattr(pipeline_module, "datetime", _FrozenDatetime)
+        output_root = tmp_path / "out"
+        pdfs = []
+        for folder in ("a", "b"):
+            (tmp_path / folder).mkdir()
+            pdf = tmp_path / folder / "report.pdf"
+            pdf.write_bytes(b"%PDF-1.4")
+            pdfs.append(pdf)
+
+        def process(**kwargs):
+            return {"pages": [{"markdown": "# Report", "index": 0}]}
+
+        first, second = (
+            pdf_to_markdown_pipeline(
+                pdf, output_root, client=_ocr_client(process), max_upload_bytes=0
+            )
+            for pdf in pdfs
+        )
+
+        assert first.parent.name == "20260101_120000_report"
+        assert second.parent.name == "20260101_120000-2_report"
+        assert first.is_file() and second.is_file()
+
+    def test_same_stem_pdfs_in_one_batch_get_separate_directories(
+        self, monkeypatch, tmp_path
+    ):
+        """Test that a packed batch never shares a directory between same-stem PDFs."""
+        monkeypatch.setattr(pipeline_module, "datetime", _FrozenDatetime)
+        pdfs = [_write_blank_pdf(tmp_path / folder / "report.pdf") for folder in ("a", "b")]
+
+        def process(**kwargs):
+            return {
+                "pages": [
+                    {"markdown": "# First", "index": 0},
+                    {"markdown": "# Second", "index": 1},
+                ]
+            }
+
+        first, second = pdf_batch_to_markdown_pipeline(
+            pdfs, tmp_path / "out", client=_ocr_client(process)
+        )
+
+        assert first.parent.name == "20260101_120000_report"
+        assert second.parent.name == "20260101_120000-2_report"
+        assert first.read_text(encoding="utf-8").startswith("# First")
+        assert second.read_text(encoding="utf-8").startswith("# Second")
+
+    def test_split_conversion_with_a_failed_page_fails(self, tmp_path):
+        """Test that a split PDF with a dropped page fails instead of writing partial output."""
+        pdf = _write_blank_pdf(tmp_path / "doc.pdf", pages=3)
+        output_root = tmp_path / "out"
+        lock = threading.Lock()
+        calls = 0
+
+        def process(**kwargs):
+            nonlocal calls
+            with lock:
+                calls += 1
+                call = calls
+            if call == 2:
+                raise ValueError("bad page")
+            return {"pages": [{"markdown": "# Page", "index": 0}]}
+
+        with pytest.raises(RuntimeError, match="OCR failed for 1 page") as excinfo:
+            pdf_to_markdown_pipeline(
+                pdf, output_root, client=_ocr_client(process), max_upload_bytes=1
+            )
+
+        assert isinstance(excinfo.value.__cause__, ValueError)
+        assert list(output_root.iterdir()) == []
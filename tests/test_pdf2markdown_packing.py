@@ -0,0 +1,84 @@
+"""Unit tests for PDF2Markdown batch packing and concurrency."""
+
+import asyncio
+import threading
+from pathlib import Path
+
+from pdf2markdown.pdf_to_markdown import (
+    _convert_concurrently,
+    _is_large_batch,
+    _pack_pdfs,
+)
+
+
+def _write(path: Path, size: int) -> Path:
+    path.write_bytes(b"x" * size)
+    return path
+
+
+class TestPackPdfs:
+    """Test first-fit-decreasing packing of PDFs into upload batches."""
+
+    def test_first_fit_decreasing(self, tmp_path):
+        """Test that PDFs are packed largest first into the first batch that fits."""
+        a = _write(tmp_path / "a.pdf", 60)
+        b = _write(tmp_path / "b.pdf", 50)
+        c = _write(tmp_path / "c.pdf", 40)
+        d = _write(tmp_path / "d.pdf", 30)
+
+        batches = _pack_pdfs([a, b, c, d], max_bytes=100)
+
+        assert batches == [[a, c], [b, d]]
+
+    def test_keeps_oversized_pdfs_alone(self, tmp_path):
+        """Test that a PDF above the limit gets a batch of its own."""
+        big = _write(tmp_path / "big.pdf", 150)
+        small = _write(tmp_path / "small.pdf", 10)
+
+        batches = _pack_pdfs([small, big], max_bytes=100)
+
+        assert batches == [[big], [small]]
+
+    def test_disabled_without_limit(self, tmp_path):
+        """Test that a zero limit puts every PDF in its own batch."""
+        a = _write(tmp_path / "a.pdf", 10)
+        b = _write(tmp_path / "b.pdf", 10)
+
+        assert _pack_pdfs([a, b], max_bytes=0) == [[a], [b]]
+
+
+class TestIsLargeBatch:
+    """Test detection of batches that need the split path."""
+
+    def test_uses_upload_limit(self, tmp_path):
+        """Test that a batch is large only when a PDF exceeds the upload limit."""
+        small = _write(tmp_path / "small.pdf", 10)
+        big = _write(tmp_path / "big.pdf", 150)
+
+        assert _is_large_batch([small, big], max_upload_bytes=100)
+        assert not _is_large_batch([small], max_upload_bytes=100)
+        assert not _is_large_batch([big], max_upload_bytes=0)
+
+
+class TestConvertConcurrently:
+    """Test concurrent batch conversion."""
+
+    def test_runs_every_worker_in_parallel(self):
+        """Test that every worker can block in convert at the same time."""
+        # More workers than the default executor's min(32, cpu + 4) threads on
+        # small machines: all of them must be blocked in convert at once.
+        concurrency = 12
+        barrier = threading.Barrier(concurrency, timeout=5)
+        batches = [[Path(f"{idx}.pdf")] for idx in range(concurrency)]
+
+        async def _convert(pending):
+            await asyncio.to_thread(barrier.wait)
+            return list(pending)
+
+        converted, skipped, total = asyncio.run(
+            _convert_concurrently(
+                batches, _convert, lambda batch: dict.fromkeys(batch, ""), concurrency
+            )
+        )
+
+        assert (converted, skipped, total) == (concurrency, 0, concurrency)
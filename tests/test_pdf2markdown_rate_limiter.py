@@ -0,0 +1,56 @@
+"""Unit tests for the PDF2Markdown request rate limiter."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pdf2markdown.utils.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Test request spacing and in-flight caps."""
+
+    def test_spaces_request_starts(self):
+        """Test that request starts are spaced by 1 / rps seconds."""
+        limiter = RateLimiter(rps=20)
+        starts = []
+
+        def _request() -> None:
+            with limiter:
+                starts.append(time.monotonic())
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: _request(), range(3)))
+
+        starts.sort()
+        assert starts[-1] - starts[0] >= 0.09
+
+    def test_caps_in_flight_requests(self):
+        """Test that no more than max_concurrency requests run at once."""
+        limiter = RateLimiter(max_concurrency=2)
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def _request() -> None:
+            nonlocal in_flight, peak
+            with limiter:
+                with lock:
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                time.sleep(0.02)
+                with lock:
+                    in_flight -= 1
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(lambda _: _request(), range(6)))
+
+        assert peak == 2
+
+    def test_disabled_by_default(self):
+        """Test that a limiter without settings does not delay requests."""
+        limiter = RateLimiter()
+        start = time.monotonic()
+        for _ in range(50):
+            with limiter:
+                pass
+        assert time.monotonic() - start < 0.05
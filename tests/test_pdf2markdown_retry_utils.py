@@ -0,0 +1,106 @@
+"""Unit tests for PDF2Markdown retry helpers."""
+
+import pytest
+
+from pdf2markdown.utils import retry_utils
+from pdf2markdown.utils.retry_utils import (
+    backoff_delay,
+    is_rate_limit_error,
+    is_transient_http_error,
+    retry_with_backoff,
+)
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class TestIsRateLimitError:
+    """Test rate-limit classification."""
+
+    def test_status_429_is_rate_limit(self):
+        """Test that an HTTP 429 status is classified as rate limiting."""
+        assert is_rate_limit_error(_StatusError(429))
+
+    def test_quota_message_is_rate_limit(self):
+        """Test that quota messages are classified as rate limiting."""
+        assert is_rate_limit_error(RuntimeError("Monthly quota exceeded"))
+
+    def test_wrapped_rate_limit_is_detected(self):
+        """Test that a rate limit raised as the cause of another error is detected."""
+        try:
+            try:
+                raise _StatusError(429)
+            except _StatusError as inner:
+                raise RuntimeError("Vision refinement failed") from inner
+        except RuntimeError as exc:
+            assert is_rate_limit_error(exc)
+
+    def test_other_errors_are_not_rate_limit(self):
+        """Test that unrelated errors are not retried."""
+        assert not is_rate_limit_error(_StatusError(500))
+        assert not is_rate_limit_error(ValueError("bad input"))
+
+
+class TestBackoffDelay:
+    """Test exponential backoff delays."""
+
+    def test_doubles_per_attempt_without_jitter(self):
+        """Test that delays double per attempt when jitter is disabled."""
+        assert [backoff_delay(a, 1.0, 30.0, 0.0) for a in range(4)] == [1, 2, 4, 8]
+
+    def test_capped_at_max_delay(self):
+        """Test that the delay never exceeds max_delay before jitter."""
+        assert backoff_delay(10, 1.0, 30.0, 0.0) == 30.0
+
+    def test_jitter_is_proportional(self):
+        """Test that jitter adds at most the given fraction of the delay."""
+        delay = backoff_delay(1, 1.0, 30.0, 0.5)
+        assert delay == pytest.approx(2.5, abs=0.5)
+
+
+class TestRetryWithBackoff:
+    """Test the retry wrapper used around OCR and vision requests."""
+
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, monkeypatch):
+        self.sleeps = []
+        monkeypatch.setattr(retry_utils.time, "sleep", self.sleeps.append)
+
+    def test_transient_status_codes_are_retryable(self):
+        """Test that 429 and 5xx gateway errors are transient but 400 is not."""
+        assert is_transient_http_error(_StatusError(503))
+        assert is_transient_http_error(RuntimeError("rate limit reached"))
+        assert not is_transient_http_error(_StatusError(400))
+
+    def test_retries_until_success_with_doubling_delays(self):
+        """Test that retryable failures are retried with exponential backoff."""
+        outcomes = [_StatusError(503), _StatusError(429), "ok"]
+
+        def _call():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        result = retry_with_backoff(
+            _call, is_retryable=is_transient_http_error, base_delay=1.0, jitter=0.0
+        )
+
+        assert result == "ok"
+        assert self.sleeps == [1.0, 2.0]
+
+    def test_non_retryable_error_is_raised_immediately(self):
+        """Test that a non-retryable error is not retried."""
+        calls = []
+
+        def _call():
+            calls.append(1)
+            raise _StatusError(400)
+
+        with pytest.raises(_StatusError):
+            retry_with_backoff(_call, is_retryable=is_transient_http_error)
+        assert len(calls) == 1
+        assert self.sleeps == []
@@ -0,0 +1,54 @@
+"""Unit tests for PDF2Markdown settings loading."""
+
+import pytest
+
+from pdf2markdown.utils import settings as settings_module
+
+
+class TestGetSettings:
+    """Test OCR and vision settings read from the environment."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_settings_cache(self, monkeypatch):
+        monkeypatch.setattr(settings_module, "load_llm_config", lambda: {})
+        settings_module.get_settings.cache_clear()
+        settings_module.get_vision_settings.cache_clear()
+        yield
+        settings_module.get_settings.cache_clear()
+        settings_module.get_vision_settings.cache_clear()
+
+    def test_defaults(self, monkeypatch):
+        """Test that unset variables fall back to the documented defaults."""
+        for name in (
+            "PDF_CONCURRENCY",
+            "OCR_CONCURRENCY",
+            "MAX_UPLOAD_BYTES",
+            "VISION_TEMPERATURE",
+        ):
+            monkeypatch.delenv(name, raising=False)
+        settings = settings_module.get_settings()
+        assert settings.pdf_concurrency == 4
+        assert settings.ocr_concurrency == 16
+        assert settings.max_upload_bytes == 10 * 1024 * 1024
+        assert settings_module.get_vision_settings().temperature == 0.0
+
+    def test_reads_env(self, monkeypatch):
+        """Test that integer and float values are parsed from the environment."""
+        monkeypatch.setenv("PDF_CONCURRENCY", "8")
+        monkeypatch.setenv("PDF_RETRY_JITTER", "0.25")
+        settings = settings_module.get_settings()
+        assert settings.pdf_concurrency == 8
+        assert settings.pdf_retry_jitter == 0.25
+
+    def test_rejects_malformed_value(self, monkeypatch):
+        """Test that a malformed value names the variable in the error."""
+        monkeypatch.setenv("PDF_MAX_RETRIES", "three")
+        with pytest.raises(ValueError, match="PDF_MAX_RETRIES.*'three'"):
+            settings_module.get_settings()
+
+    def test_vision_values_do_not_affect_ocr_settings(self, monkeypatch):
+        """Test that a bad vision value only fails the vision settings."""
+        monkeypatch.setenv("VISION_MAX_ROUNDS", "three")
+        settings_module.get_settings()
+        with pytest.raises(ValueError, match="VISION_MAX_ROUNDS.*'three'"):
+            settings_module.get_vision_settings()
@@ -0,0 +1,37 @@
+"""Unit tests for PDF2Markdown split-PDF page scheduling."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pdf2markdown.utils.pdf_to_markdown_pipeline import _map_bounded
+
+
+class TestMapBounded:
+    """Test the bounded executor map used for split PDFs."""
+
+    def test_keeps_order_and_limits_items_in_flight(self):
+        """Test that results keep input order and at most window items are pending."""
+        lock = threading.Lock()
+        produced = 0
+        finished = 0
+        max_ahead = 0
+
+        def items():
+            nonlocal produced, max_ahead
+            for value in range(20):
+                with lock:
+                    produced += 1
+                    max_ahead = max(max_ahead, produced - finished)
+                yield value
+
+        def square(value):
+            nonlocal finished
+            with lock:
+                finished += 1
+            return value * value
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(_map_bounded(executor, square, items(), 3))
+
+        assert results == [value * value for value in range(20)]
+        assert max_ahead <= 3
@@ -0,0 +1,253 @@
+"""Unit tests for PDF2Markdown vision refinement windows."""
+
+import base64
+import io
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from pdf2markdown.utils.pdf_to_markdown_pipeline import (
+    _needs_vision_refinement,
+    _PairwiseVisionRefiner,
+    _refine_page_group_with_vision,
+    _shrink_image_b64,
+    _vision_refinement,
+)
+
+# pdf2markdown.utils re-exports the pdf_to_markdown_pipeline function under the
+# module's own name, so the module is looked up directly for monkeypatching.
+pipeline_module = sys.modules[_PairwiseVisionRefiner.__module__]
+
+
+def _patch_refine(monkeypatch, transform):
+    """Replace the vision call with transform and return the list of windows it saw."""
+    calls = []
+
+    def fake_refine(*, page_numbers, original_markdowns, **kwargs):
+        calls.append(tuple(page_numbers))
+        return transform(page_numbers, original_markdowns)
+
+    monkeypatch.setattr(pipeline_module, "_refine_page_group_with_vision", fake_refine)
+    return calls
+
+
+def _tag_with_first_page(page_numbers, markdowns):
+    return [f"{markdown}+{page_numbers[0]}" for markdown in markdowns]
+
+
+def _text_pages(markdowns):
+    return [
+        {"markdown": markdown, "image_base64": None, "index": index}
+        for index, markdown in enumerate(markdowns)
+    ]
+
+
+def _refine(pages, *, concurrency=4, refine_all=False, window_size=2):
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        refiner = _PairwiseVisionRefiner(
+            executor,
+            image_max_dim=1600,
+            refine_all=refine_all,
+            window_size=window_size,
+            client=None,
+            model="vision",
+        )
+        for page in pages:
+            refiner.add_page(page)
+        refiner.finish()
+
+
+def _tool_response(name, arguments):
+    tool_call = SimpleNamespace(
+        function=SimpleNamespace(name=name, arguments=json.dumps(arguments))
+    )
+    message = SimpleNamespace(tool_calls=[tool_call])
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class TestPairwiseVisionRefiner:
+    """Test how pages are grouped into vision windows."""
+
+    def test_covers_every_boundary_in_two_phases(self, monkeypatch):
+        """Test that disjoint pairs run first and the shared boundaries second."""
+        calls = _patch_refine(monkeypatch, _tag_with_first_page)
+        pages = _text_pages([f"p{number}" for number in range(1, 6)])
+
+        _refine(pages, concurrency=2, refine_all=True)
+
+        assert sorted(calls[:2]) == [(1, 2), (3, 4)]
+        assert sorted(calls[2:]) == [(2, 3), (4, 5)]
+        assert [page["markdown"] for page in pages] == [
+            "p1+1",
+            "p2+1+2",
+            "p3+3+2",
+            "p4+3+4",
+            "p5+4",
+        ]
+
+    def test_larger_windows_share_one_boundary_page(self, monkeypatch):
+        """Test that windows of three pages overlap on exactly one page."""
+        calls = _patch_refine(monkeypatch, _tag_with_first_page)
+        pages = _text_pages([f"p{number}" for number in range(1, 7)])
+
+        _refine(pages, refine_all=True, window_size=3)
+
+        assert sorted(calls[:2]) == [(1, 2, 3), (5, 6)]
+        assert calls[2:] == [(3, 4, 5)]
+        assert [page["markdown"] for page in pages] == [
+            "p1+1",
+            "p2+1",
+            "p3+1+3",
+            "p4+3",
+            "p5+5+3",
+            "p6+5",
+        ]
+
+    def test_skips_blank_pages(self, monkeypatch):
+        """Test that blank pages are never sent and keep their content."""
+        calls = _patch_refine(
+            monkeypatch, lambda page_numbers, markdowns: [m.upper() for m in markdowns]
+        )
+        pages = _text_pages(["", "p2", "  ", "p4", ""])
+
+        _refine(pages, refine_all=True)
+
+        assert calls == [(2, 4)]
+        assert [page["markdown"] for page in pages] == ["", "P2", "  ", "P4", ""]
+
+    def test_skips_windows_that_look_clean(self, monkeypatch):
+        """Test that only windows containing a suspect page are refined."""
+        calls = _patch_refine(monkeypatch, lambda page_numbers, markdowns: markdowns)
+        pages = _text_pages(["p1", "p2", "p3 \ufffd", "p4", "p5"])
+
+        _refine(pages)
+
+        assert sorted(calls) == [(2, 3), (3, 4)]
+
+
+class TestNeedsVisionRefinement:
+    """Test the OCR-defect heuristic that decides which pages are refined."""
+
+    def test_flags_broken_tables_and_glyphs(self):
+        """Test that mismatched table rows and replacement characters are flagged."""
+        assert not _needs_vision_refinement("# Title\n\n| a | b |\n|---|---|\n| 1 | 2 |")
+        assert _needs_vision_refinement("| a | b |\n|---|---|\n| 1 | 2 | 3 |")
+        assert _needs_vision_refinement("broken \ufffd glyph")
+
+    def test_ignores_prose_paragraphs(self):
+        """Test that long single-line paragraphs are not flagged."""
+        paragraph = " ".join(["Emissions fell across every sector this year."] * 30)
+
+        assert not _needs_vision_refinement(f"# Summary\n\n{paragraph}\n\n{paragraph}")
+
+    def test_always_flags_image_pages(self):
+        """Test that pages with images or figures are always refined."""
+        assert _needs_vision_refinement("![img-0.jpeg](img-0.jpeg)")
+        assert _needs_vision_refinement("Figure 3\n\n![chart](img-1.png)\n\nSource: city data")
+
+    def test_counts_table_cells(self):
+        """Test that outer pipes are optional and escaped pipes are cell text."""
+        assert not _needs_vision_refinement("a | b\n--- | ---\n1 | 2")
+        assert not _needs_vision_refinement("| a | b |\n|---|---|\n| x \\| y | 2 |")
+        assert _needs_vision_refinement("a | b\n--- | ---\n1 | 2 | 3")
+        # Pipes in prose outside a table are not table rows.
+        assert not _needs_vision_refinement("either | or\nthis | that | other")
+
+
+class TestShrinkImage:
+    """Test page image downscaling before vision requests."""
+
+    def test_downscales_large_images(self):
+        """Test that images are shrunk to max_dim and re-encoded as JPEG."""
+        Image = pytest.importorskip("PIL.Image")
+        buffer = io.BytesIO()
+        Image.new("RGB", (3200, 1600), "white").save(buffer, format="PNG")
+        original = base64.b64encode(buffer.getvalue()).decode("ascii")
+
+        shrunk = _shrink_image_b64(original, max_dim=800)
+
+        with Image.open(io.BytesIO(base64.b64decode(shrunk))) as image:
+            assert image.size == (800, 400)
+            assert image.format == "JPEG"
+        assert _shrink_image_b64(original, max_dim=0) == original
+
+
+class TestRefinePageGroupWithVision:
+    """Test the vision request loop for one page window."""
+
+    def test_stops_when_edits_do_not_change_markdown(self, tmp_path):
+        """Test that a no-op edit ends the loop without another round or diff."""
+        responses = [
+            _tool_response(
+                "apply_page_group_edits",
+                {"updated_pages": [{"page_number": 1, "updated_markdown": "same"}]},
+            ),
+            _tool_response("approve_page_group", {}),
+        ]
+        calls = []
+
+        def create(**kwargs):
+            calls.append(kwargs)
+            return responses[len(calls) - 1]
+
+        client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+
+        result = _refine_page_group_with_vision(
+            client=client,
+            model="vision",
+            page_numbers=[1, 2],
+            original_markdowns=["same", "other"],
+            images_b64=[None, None],
+            output_dir=tmp_path,
+            max_rounds=3,
+            temperature=0.0,
+            max_attempts=1,
+            retry_base_delay=0.0,
+        )
+
+        assert result == ["same", "other"]
+        assert len(calls) == 1
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestVisionRefinementContext:
+    """Test the vision refinement context used while OCR produces pages."""
+
+    def test_cancels_queued_windows_when_ocr_fails(self, monkeypatch, tmp_path):
+        """Test that an OCR failure drops windows that have not started."""
+        release = threading.Event()
+
+        def wait_then_keep(page_numbers, markdowns):
+            release.wait(timeout=5)
+            return markdowns
+
+        calls = _patch_refine(monkeypatch, wait_then_keep)
+        # Let the running window finish once the failure has cancelled the queue.
+        timer = threading.Timer(0.2, release.set)
+        timer.start()
+
+        with pytest.raises(RuntimeError, match="OCR down"):
+            with _vision_refinement(
+                tmp_path / "doc.pdf",
+                document_dir=tmp_path,
+                vision_model="vision",
+                vision_max_rounds=1,
+                vision_temperature=0.0,
+                vision_max_retries=1,
+                vision_retry_base_delay=0.0,
+                vision_concurrency=1,
+                vision_refine_all=True,
+                vision_client=object(),
+            ) as add_page:
+                for number in range(1, 10):
+                    add_page({"markdown": f"p{number}", "image_base64": None})
+                raise RuntimeError("OCR down")
+        timer.cancel()
+
+        assert calls == [(1, 2)]